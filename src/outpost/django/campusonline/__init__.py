@@ -0,0 +1 @@
+default_app_config = "outpost.django.campusonline.apps.CampusonlineConfig"
@@ -9,7 +9,6 @@ from rest_framework.permissions import (
     IsAuthenticated,
 )
 from rest_framework.viewsets import ReadOnlyModelViewSet
-from rest_framework_extensions.cache.mixins import CacheResponseMixin
 
 from . import (
     filters,
@@ -17,6 +16,19 @@ from . import (
     models,
     serializers,
 )
+from .mixins import (
+    ColumnarExportMixin,
+    ConditionalMixin,
+    CSVExportMixin,
+    DocumentMixin,
+    LanguageProjectionMixin,
+    ORJSONRendererMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    StreamingListMixin,
+    ValuesListMixin,
+)
+from .pagination import NaturalOrderingCursorPagination
 
 # from rest_framework_extensions.mixins import (
 #     CacheResponseAndETAGMixin,
@@ -26,7 +38,12 @@ from . import (
 # )
 
 
-class RoomCategoryViewSet(CacheResponseMixin, ReadOnlyModelViewSet):
+class RoomCategoryViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     queryset = models.RoomCategory.objects.all()
     serializer_class = serializers.RoomCategorySerializer
     object_cache_key_func = key_constructors.PersonKeyConstructor()
@@ -34,20 +51,41 @@ class RoomCategoryViewSet(CacheResponseMixin, ReadOnlyModelViewSet):
     permission_classes = (AllowAny,)
 
 
-class RoomViewSet(ReadOnlyModelViewSet):
+class RoomViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    DocumentMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     queryset = models.Room.objects.all()
     serializer_class = serializers.RoomSerializer
     permission_classes = (AllowAny,)
-    filter_fields = ("category",)
+    filter_backends = (DjangoFilterBackend,)
+    filter_class = filters.RoomFilter
 
 
-class FloorViewSet(ReadOnlyModelViewSet):
+class FloorViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     queryset = models.Floor.objects.all()
     serializer_class = serializers.FloorSerializer
     permission_classes = (AllowAny,)
 
 
-class BuildingViewSet(ReadOnlyModelViewSet):
+class BuildingViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     queryset = models.Building.objects.all()
     serializer_class = serializers.BuildingSerializer
     permission_classes = (AllowAny,)
@@ -58,7 +96,13 @@ class BuildingViewSet(ReadOnlyModelViewSet):
     filter=filters.FunctionFilter.__doc__,
     serializer=serializers.FunctionSerializer.__doc__,
 )
-class FunctionViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class FunctionViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List organizational functions from CAMPUSonline.
 
@@ -75,7 +119,13 @@ class FunctionViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     permit_list_expands = ("persons",)
 
 
-class OrganizationTypeViewSet(ReadOnlyModelViewSet):
+class OrganizationTypeViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     queryset = models.OrganizationType.objects.all()
     serializer_class = serializers.OrganizationTypeSerializer
     permission_classes = (AllowAny,)
@@ -86,7 +136,17 @@ class OrganizationTypeViewSet(ReadOnlyModelViewSet):
     filter=filters.OrganizationFilter.__doc__,
     serializer=serializers.OrganizationSerializer.__doc__,
 )
-class OrganizationViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class OrganizationViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    ColumnarExportMixin,
+    RefreshCacheResponseMixin,
+    DocumentMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List organizations from CAMPUSonline.
 
@@ -123,7 +183,17 @@ class OrganizationViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     filter=filters.PersonFilter.__doc__,
     serializer=serializers.PersonSerializer.__doc__,
 )
-class PersonViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class PersonViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    ColumnarExportMixin,
+    StreamingListMixin,
+    RefreshCacheResponseMixin,
+    DocumentMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List staff accounts from CAMPUSonline.
 
@@ -136,6 +206,7 @@ class PersonViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     serializer_class = serializers.PersonSerializer
     filter_backends = (DjangoFilterBackend,)
     filter_class = filters.PersonFilter
+    pagination_class = NaturalOrderingCursorPagination
     permission_classes = (AllowAny,)
     permit_list_expands = (
         "functions",
@@ -169,7 +240,14 @@ class PersonViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     filter=filters.StudentFilter.__doc__,
     serializer=serializers.StudentSerializer.__doc__,
 )
-class StudentViewSet(ReadOnlyModelViewSet):
+class StudentViewSet(
+    ConditionalMixin,
+    StreamingListMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List student accounts from CAMPUSonline.
 
@@ -182,6 +260,7 @@ class StudentViewSet(ReadOnlyModelViewSet):
     serializer_class = serializers.StudentSerializer
     filter_backends = (DjangoFilterBackend,)
     filter_class = filters.StudentFilter
+    pagination_class = NaturalOrderingCursorPagination
     permission_classes = (IsAuthenticated,)
 
     def get_serializer_class(self):
@@ -192,7 +271,12 @@ class StudentViewSet(ReadOnlyModelViewSet):
 
 
 @docstring_format(filter=filters.PersonOrganizationFunctionFilter.__doc__)
-class PersonOrganizationFunctionViewSet(ReadOnlyModelViewSet):
+class PersonOrganizationFunctionViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     Map person to organizational unit and function through CAMPUSonline.
 
@@ -212,7 +296,12 @@ class PersonOrganizationFunctionViewSet(ReadOnlyModelViewSet):
     serializer=serializers.DistributionListSerializer.__doc__,
 )
 class DistributionListViewSet(
-    CacheResponseMixin, FlexFieldsMixin, ReadOnlyModelViewSet
+    ConditionalMixin,
+    StreamingListMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
 ):
     """
     List distribution lists from CAMPUSonline.
@@ -233,7 +322,13 @@ class DistributionListViewSet(
 
 
 @docstring_format(model=models.Event.__doc__, filter=filters.EventFilter.__doc__)
-class EventViewSet(ReadOnlyModelViewSet):
+class EventViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List events from CAMPUSonline.
 
@@ -248,19 +343,34 @@ class EventViewSet(ReadOnlyModelViewSet):
     permission_classes = (AllowAny,)
 
     def get_queryset(self):
-        return self.queryset.filter(show_end__gte=timezone.now())
-
-
-class CourseGroupTermViewSet(ReadOnlyModelViewSet):
+        return super().get_queryset().filter(show_end__gte=timezone.now())
+
+
+class CourseGroupTermViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    ColumnarExportMixin,
+    StreamingListMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     queryset = models.CourseGroupTerm.objects.all()
     serializer_class = serializers.CourseGroupTermSerializer
     filter_backends = (DjangoFilterBackend,)
     filter_class = filters.CourseGroupTermFilter
+    pagination_class = NaturalOrderingCursorPagination
     permission_classes = (IsAuthenticated,)
 
 
 @docstring_format(model=models.Bulletin.__doc__, filter=filters.BulletinFilter.__doc__)
-class BulletinViewSet(ReadOnlyModelViewSet):
+class BulletinViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List official bulletins from CAMPUSonline.
 
@@ -277,7 +387,12 @@ class BulletinViewSet(ReadOnlyModelViewSet):
 @docstring_format(
     model=models.BulletinPage.__doc__, filter=filters.BulletinPageFilter.__doc__
 )
-class BulletinPageViewSet(ReadOnlyModelViewSet):
+class BulletinPageViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List official bulletin pages with extracted text from CAMPUSonline.
 
@@ -303,7 +418,16 @@ class BulletinPageSearchViewSet(HaystackViewSet):
     filter=filters.FinalThesisFilter.__doc__,
     serializer=serializers.FinalThesisSerializer.__doc__,
 )
-class FinalThesisViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class FinalThesisViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    ColumnarExportMixin,
+    RefreshCacheResponseMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List final thesis from CAMPUSonline.
 
@@ -325,7 +449,15 @@ class FinalThesisViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     filter=filters.CountryFilter.__doc__,
     serializer=serializers.CountrySerializer.__doc__,
 )
-class CountryViewSet(ReadOnlyModelViewSet):
+class CountryViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List countries from CAMPUSonline.
 
@@ -346,7 +478,14 @@ class CountryViewSet(ReadOnlyModelViewSet):
     filter=filters.ExamModeFilter.__doc__,
     serializer=serializers.ExamModeSerializer.__doc__,
 )
-class ExamModeViewSet(ReadOnlyModelViewSet):
+class ExamModeViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List exam modes from CAMPUSonline.
 
@@ -367,7 +506,14 @@ class ExamModeViewSet(ReadOnlyModelViewSet):
     filter=filters.ExamTypeFilter.__doc__,
     serializer=serializers.ExamTypeSerializer.__doc__,
 )
-class ExamTypeViewSet(ReadOnlyModelViewSet):
+class ExamTypeViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List exam types from CAMPUSonline.
 
@@ -388,7 +534,16 @@ class ExamTypeViewSet(ReadOnlyModelViewSet):
     filter=filters.ExamFilter.__doc__,
     serializer=serializers.ExamSerializer.__doc__,
 )
-class ExamViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class ExamViewSet(
+    ORJSONRendererMixin,
+    ConditionalMixin,
+    CSVExportMixin,
+    ColumnarExportMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List exams from CAMPUSonline.
 
@@ -410,7 +565,14 @@ class ExamViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     filter=filters.ExamineeStatusFilter.__doc__,
     serializer=serializers.ExamineeStatusSerializer.__doc__,
 )
-class ExamineeStatusViewSet(ReadOnlyModelViewSet):
+class ExamineeStatusViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    ValuesListMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List examinee status from CAMPUSonline.
 
@@ -431,7 +593,15 @@ class ExamineeStatusViewSet(ReadOnlyModelViewSet):
     filter=filters.ExamineeFilter.__doc__,
     serializer=serializers.ExamineeSerializer.__doc__,
 )
-class ExamineeViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class ExamineeViewSet(
+    ConditionalMixin,
+    CSVExportMixin,
+    ColumnarExportMixin,
+    RefreshCacheResponseMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List examinees from CAMPUSonline.
 
@@ -444,8 +614,25 @@ class ExamineeViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     serializer_class = serializers.ExamineeSerializer
     filter_backends = (DjangoFilterBackend,)
     filter_class = filters.ExamineeFilter
+    pagination_class = NaturalOrderingCursorPagination
     permission_classes = (ExtendedDjangoModelPermissions,)
     permit_list_expands = ("exam", "student", "status")
+    csv_columns = (
+        "id",
+        "exam",
+        "exam__start",
+        "exam__course",
+        "exam__course__name",
+        "student",
+        "student__matriculation",
+        "student__last_name",
+        "student__first_name",
+        "status",
+        "status__short",
+        "status_datetime",
+        "registration",
+        "assessment_closure",
+    )
 
 
 @docstring_format(
@@ -453,7 +640,14 @@ class ExamineeViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
     filter=filters.ScienceBranchFilter.__doc__,
     serializer=serializers.ScienceBranchSerializer.__doc__,
 )
-class ScienceBranchViewSet(FlexFieldsMixin, ReadOnlyModelViewSet):
+class ScienceBranchViewSet(
+    ConditionalMixin,
+    RefreshCacheResponseMixin,
+    LanguageProjectionMixin,
+    SerializerRelatedMixin,
+    FlexFieldsMixin,
+    ReadOnlyModelViewSet,
+):
     """
     List science branches from CAMPUSonline.
 
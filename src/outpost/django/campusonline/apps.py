@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class CampusonlineConfig(AppConfig):
+    name = "outpost.django.campusonline"
+    label = "campusonline"
+
+    def ready(self):
+        from . import autocomplete
+        from .conf import settings
+
+        if settings.CAMPUSONLINE_AUTOCOMPLETE_WARM:
+            for index in autocomplete.registry.values():
+                index.warm()
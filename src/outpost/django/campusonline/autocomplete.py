@@ -0,0 +1,229 @@
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from django.db import connection
+
+from . import (
+    models,
+    normalize,
+    refresh,
+)
+from .conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PrefixIndex:
+    """
+    Sorted array of folded keys pointing to entries, answering prefix queries
+    with two binary searches.
+    """
+
+    def __init__(self, items):
+        self.entries = []
+        pairs = []
+        for keys, entry in items:
+            ref = len(self.entries)
+            self.entries.append(entry)
+            pairs.extend((k, ref) for k in {normalize.fold(k) for k in keys if k})
+        pairs.sort()
+        self.keys = [k for k, _ in pairs]
+        self.refs = array("I", (r for _, r in pairs))
+
+    def search(self, prefix, limit):
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, f"{prefix}\uffff", start)
+        seen = set()
+        result = []
+        for position in range(start, end):
+            ref = self.refs[position]
+            if ref in seen:
+                continue
+            seen.add(ref)
+            result.append(self.entries[ref])
+            if len(result) == limit:
+                break
+        return result
+
+
+class Autocomplete:
+    """
+    In-process prefix indexes over the names of a model, rebuilt as soon as
+    the refresh generation of the model changes. The generation is checked
+    at most every `CAMPUSONLINE_AUTOCOMPLETE_CHECK_INTERVAL` seconds.
+
+    Indexes are built in a background thread, started by `warm()` when the
+    application is loaded or when a check finds them outdated. Requests keep
+    using the previous indexes while a new one is built and are answered with
+    `503 Service Unavailable` before the first one is ready.
+    """
+
+    model = None
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.generation = None
+        self.checked = 0
+        self.indexes = None
+
+    def build(self):
+        raise NotImplementedError()
+
+    def index(self, request):
+        raise NotImplementedError()
+
+    def update(self):
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            generation = refresh.generation(self.model)
+            if generation != self.generation:
+                self.indexes = self.build()
+                self.generation = generation
+        finally:
+            self.lock.release()
+
+    def background(self):
+        try:
+            self.update()
+        except Exception:
+            logger.exception(f"Failed to build autocomplete for {self.model}")
+        finally:
+            connection.close()
+
+    def warm(self):
+        self.checked = time.monotonic()
+        threading.Thread(target=self.background, daemon=True).start()
+
+    @property
+    def ready(self):
+        return self.indexes is not None
+
+    def current(self):
+        now = time.monotonic()
+        if now - self.checked >= settings.CAMPUSONLINE_AUTOCOMPLETE_CHECK_INTERVAL:
+            self.warm()
+        return self.indexes
+
+    def search(self, request, prefix, limit):
+        index = self.index(request)
+        if index is None:
+            return None
+        return index.search(prefix, limit)
+
+
+def name_keys(first_name, last_name):
+    first_name = first_name or ""
+    last_name = last_name or ""
+    return (
+        first_name,
+        last_name,
+        f"{first_name} {last_name}".strip(),
+        f"{last_name} {first_name}".strip(),
+    )
+
+
+class PersonAutocomplete(Autocomplete):
+    """
+    Anonymous users only find persons that are currently employed, like in
+    `PersonViewSet`.
+    """
+
+    model = models.Person
+
+    def build(self):
+        persons = self.model.objects.values_list(
+            "id", "title", "first_name", "last_name", "employed"
+        )
+        everyone = []
+        employed = []
+        for pk, title, first_name, last_name, active in persons.iterator():
+            item = (
+                name_keys(first_name, last_name),
+                {
+                    "id": pk,
+                    "title": title,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                },
+            )
+            everyone.append(item)
+            if active:
+                employed.append(item)
+        return {True: PrefixIndex(everyone), False: PrefixIndex(employed)}
+
+    def index(self, request):
+        indexes = self.current()
+        if indexes is None:
+            return None
+        return indexes[bool(request.user and request.user.is_authenticated)]
+
+
+class StudentAutocomplete(Autocomplete):
+    """
+    Only available to authenticated users, like `StudentViewSet`.
+    """
+
+    model = models.Student
+
+    def build(self):
+        students = self.model.objects.values_list(
+            "id", "title", "first_name", "last_name", "matriculation"
+        )
+        items = []
+        for pk, title, first_name, last_name, matriculation in students.iterator():
+            items.append(
+                (
+                    name_keys(first_name, last_name) + (matriculation,),
+                    {
+                        "id": pk,
+                        "title": title,
+                        "first_name": first_name,
+                        "last_name": last_name,
+                    },
+                )
+            )
+        return {True: PrefixIndex(items)}
+
+    def index(self, request):
+        if not (request.user and request.user.is_authenticated):
+            return None
+        indexes = self.current()
+        return None if indexes is None else indexes[True]
+
+
+class RoomAutocomplete(Autocomplete):
+    model = models.Room
+
+    def build(self):
+        rooms = self.model.objects.values_list(
+            "id", "title", "name_short", "name_full"
+        )
+        return {
+            None: PrefixIndex(
+                (
+                    (title, name_short, name_full) + tuple((name_full or "").split()),
+                    {
+                        "id": pk,
+                        "title": title,
+                        "name_short": name_short,
+                        "name_full": name_full,
+                    },
+                )
+                for pk, title, name_short, name_full in rooms.iterator()
+            )
+        }
+
+    def index(self, request):
+        indexes = self.current()
+        return None if indexes is None else indexes[None]
+
+
+registry = {
+    "person": PersonAutocomplete(),
+    "student": StudentAutocomplete(),
+    "room": RoomAutocomplete(),
+}
@@ -0,0 +1,105 @@
+from itertools import islice
+
+from django.core.exceptions import FieldDoesNotExist
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def arrow_type(field):
+    """
+    Map a model field to an Arrow type, falling back to strings.
+    """
+    if field.is_relation:
+        return arrow_type(field.target_field)
+    internal = field.get_internal_type()
+    if internal in (
+        "AutoField",
+        "BigAutoField",
+        "IntegerField",
+        "BigIntegerField",
+        "SmallIntegerField",
+        "PositiveIntegerField",
+        "PositiveSmallIntegerField",
+    ):
+        return pyarrow.int64()
+    if internal in ("BooleanField", "NullBooleanField"):
+        return pyarrow.bool_()
+    if internal == "DateTimeField":
+        return pyarrow.timestamp("us", tz="UTC")
+    if internal == "DateField":
+        return pyarrow.date32()
+    if internal in ("DecimalField", "FloatField"):
+        return pyarrow.float64()
+    if internal == "BinaryField":
+        return pyarrow.binary()
+    if internal == "HStoreField":
+        return pyarrow.map_(pyarrow.string(), pyarrow.string())
+    return pyarrow.string()
+
+
+def arrow_value(field):
+    """
+    Return a callable converting database values of a model field into
+    values accepted by `pyarrow.array()` for its Arrow type.
+    """
+    internal = None if field.is_relation else field.get_internal_type()
+    if internal == "HStoreField":
+        return lambda v: None if v is None else list(v.items())
+    if internal == "DecimalField":
+        return lambda v: None if v is None else float(v)
+    if internal == "BinaryField":
+        return lambda v: None if v is None else bytes(v)
+    if arrow_type(field) == pyarrow.string():
+        return lambda v: None if v is None else str(v)
+    return lambda v: v
+
+
+def serializer_columns(model, serializer):
+    """
+    Yield names and model fields of all serializer fields that map directly
+    to a column of `model`. Relations are represented by their foreign key.
+    """
+    opts = model._meta
+    for name, field in serializer.fields.items():
+        if field.source == "*" or len(field.source_attrs) != 1:
+            continue
+        try:
+            model_field = opts.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            continue
+        if not model_field.concrete or model_field.many_to_many:
+            continue
+        yield name, model_field
+
+
+def schema(columns):
+    return pyarrow.schema(
+        [pyarrow.field(name, arrow_type(field)) for name, field in columns]
+    )
+
+
+def record_batches(queryset, columns, size):
+    """
+    Build Arrow record batches of `size` rows from a server-side cursor.
+    """
+    target = schema(columns)
+    converters = [arrow_value(field) for _, field in columns]
+    rows = (
+        queryset.prefetch_related(None)
+        .values_list(*(field.attname for _, field in columns))
+        .iterator(chunk_size=size)
+    )
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array([convert(v) for v in values], type=f.type)
+                for convert, values, f in zip(converters, zip(*chunk), target)
+            ],
+            schema=target,
+        )
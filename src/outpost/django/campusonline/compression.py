@@ -0,0 +1,73 @@
+import gzip
+
+from django.utils.cache import patch_vary_headers
+
+from .conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def compress(body):
+    """
+    Return a mapping of content codings to the body encoded with them.
+
+    Bodies smaller than `CAMPUSONLINE_COMPRESS_MIN_SIZE` are only kept
+    unencoded. Brotli is only used if the `brotli` package is installed.
+    """
+    bodies = {"identity": body}
+    if len(body) < settings.CAMPUSONLINE_COMPRESS_MIN_SIZE:
+        return bodies
+    bodies["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body, quality=9)
+    return bodies
+
+
+def negotiate(header, available):
+    """
+    Pick the content coding from `available` with the highest quality value
+    in an `Accept-Encoding` header, preferring brotli over gzip over the
+    unencoded body on ties.
+
+    Codings not listed take the quality of `*` if given. The unencoded body
+    stays acceptable with the lowest quality unless listed or excluded
+    explicitly and is used if nothing else is.
+    """
+    accepted = {}
+    for part in header.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    candidates = []
+    for preference, coding in enumerate(("br", "gzip", "identity")):
+        if coding not in available:
+            continue
+        default = accepted.get("*", 0.001 if coding == "identity" else 0.0)
+        quality = accepted.get(coding, default)
+        if quality > 0:
+            candidates.append((-quality, preference, coding))
+    if not candidates:
+        return "identity"
+    return min(candidates)[2]
+
+
+def apply(response, request, bodies):
+    coding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""), bodies)
+    response.content = bodies[coding]
+    if coding != "identity":
+        response["Content-Encoding"] = coding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -10,6 +10,28 @@ class CAMPUSonlineAppConf(AppConf):
     VIRTUAL_ROOMS = list()
     XML_CACHE_KEY = "campusonlineXML"
     NAME_FILTER_MIN_LENGHT = 2
+    AVATAR_CACHE = "default"
+    AVATAR_CACHE_TIMEOUT = 259200
+    AVATAR_SIZES = (32, 64, 128, 256)
+    AVATAR_FORMATS = ("jpeg", "webp")
+    AVATAR_BATCH_LIMIT = 100
+    AVATAR_PRERENDER_CHUNK_SIZE = 100
+    CURSOR_PAGE_SIZE = 100
+    CURSOR_MAX_PAGE_SIZE = 1000
+    STREAM_CHUNK_SIZE = 2000
+    CSV_SPOOL_SIZE = 16777216
+    RESPONSE_CACHE_TIMEOUT = 604800
+    UNSIGNALED_CACHE_TIMEOUT = 3600
+    COMPRESS_MIN_SIZE = 200
+    AUTOCOMPLETE_LIMIT = 10
+    AUTOCOMPLETE_MAX_LIMIT = 50
+    AUTOCOMPLETE_CHECK_INTERVAL = 10
+    AUTOCOMPLETE_WARM = True
+    SEARCH_LIMIT = 10
+    SEARCH_MAX_LIMIT = 50
+    SEARCH_CACHE_TIMEOUT = 3600
+    DOCUMENTS = False
+    DOCUMENT_HOST = None
 
     class Meta:
         prefix = "campusonline"
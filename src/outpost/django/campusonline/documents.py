@@ -0,0 +1,101 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from . import (
+    models,
+    refresh,
+    serializers,
+)
+from .conf import settings
+from .key_constructors import serializer_models
+from .mixins import (
+    apply_plan,
+    chunked,
+)
+from .renderers import (
+    ORJSONRenderer,
+    orjson,
+)
+
+variants = {
+    models.Person: {
+        False: serializers.PersonSerializer,
+        True: serializers.AuthenticatedPersonSerializer,
+    },
+    models.Organization: {
+        False: serializers.OrganizationSerializer,
+        True: serializers.AuthenticatedOrganizationSerializer,
+    },
+    models.Room: {
+        False: serializers.RoomSerializer,
+        True: serializers.RoomSerializer,
+    },
+}
+
+
+def context():
+    """
+    Serializer context used while building documents. Absolute URLs are
+    rendered for `CAMPUSONLINE_DOCUMENT_HOST`, which is required once
+    `CAMPUSONLINE_DOCUMENTS` is enabled.
+    """
+    host = settings.CAMPUSONLINE_DOCUMENT_HOST
+    if not host:
+        if settings.CAMPUSONLINE_DOCUMENTS:
+            raise ImproperlyConfigured(
+                "CAMPUSONLINE_DOCUMENT_HOST is required to build documents"
+            )
+        return {"request": None}
+    factory = APIRequestFactory()
+    return {"request": Request(factory.get("/", secure=True, HTTP_HOST=host))}
+
+
+def dependencies(model):
+    """
+    Models whose refresh requires the documents of `model` to be rebuilt.
+    """
+    result = {model}
+    for serializer_class in variants[model].values():
+        result |= serializer_models(serializer_class(context=context()))
+    return result
+
+
+def renderer():
+    """
+    Renderer producing the same bytes as the JSON responses of the viewsets.
+    """
+    if orjson is None:
+        return JSONRenderer()
+    return ORJSONRenderer()
+
+
+def build(model):
+    """
+    Replace all documents of `model` and start a new refresh generation so
+    responses rendered from the previous documents are no longer served.
+    """
+    label = model._meta.label_lower
+    ctx = context()
+    render = renderer().render
+    with transaction.atomic():
+        models.Document.objects.filter(model=label).delete()
+        for authenticated, serializer_class in variants[model].items():
+            queryset = apply_plan(
+                model._base_manager.all(), serializer_class(context=ctx)
+            )
+            for chunk in chunked(queryset, settings.CAMPUSONLINE_STREAM_CHUNK_SIZE):
+                data = serializer_class(chunk, many=True, context=ctx).data
+                models.Document.objects.bulk_create(
+                    models.Document(
+                        model=label,
+                        key=str(obj.pk),
+                        authenticated=authenticated,
+                        body=render(item).decode("utf-8"),
+                    )
+                    for obj, item in zip(chunk, data)
+                )
+    refresh.refreshed(None, model)
+
@@ -1,7 +1,18 @@
+import re
 from functools import reduce
-from operator import or_
+from operator import (
+    add,
+    and_,
+    or_,
+)
 
-from django.db.models import Q
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import (
+    CharField,
+    Q,
+    Value,
+)
+from django.db.models.functions import Greatest
 from django.utils.translation import gettext_lazy as _
 from django_filters import (
     BaseInFilter,
@@ -14,7 +25,10 @@ from django_filters.rest_framework import (
     filterset,
 )
 
-from . import models
+from . import (
+    models,
+    normalize,
+)
 from .conf import settings
 
 
@@ -22,6 +36,109 @@ class NumberInFilter(BaseInFilter, NumberFilter):
     pass
 
 
+titles = frozenset(
+    (
+        "ao",
+        "bsc",
+        "dipl",
+        "doz",
+        "dr",
+        "ing",
+        "mag",
+        "mba",
+        "mmag",
+        "msc",
+        "phd",
+        "priv",
+        "prof",
+        "univ",
+    )
+)
+
+
+def title(term):
+    parts = [p for p in normalize.fold(term).split("-") if p]
+    return bool(parts) and all(p in titles for p in parts)
+
+
+def name_terms(value):
+    """
+    Split a full name into search terms, dropping punctuation and titles.
+
+    Abbreviations ending in a dot like `Dr.` or `Univ.-Prof.` are dropped as
+    well as common academic titles written without one, like `Prof` or
+    `Univ-Prof`, which would otherwise have to match a name. If nothing is
+    left the whole value is used as a single term.
+    """
+    tokens = [t for t in re.split(r"[\s,;]+", value) if t]
+    terms = [re.sub(r"[^\w-]", "", t) for t in tokens if "." not in t]
+    return [t for t in terms if t and not title(t)] or [value.strip()]
+
+
+def search_names(queryset, terms, fields=("first_name", "last_name")):
+    """
+    Fuzzy search on the folded `fields` using `pg_trgm`.
+
+    Terms are folded in SQL by the same function as the columns, so `Müller`,
+    `Mueller` and `muller` find the same names. Every term has to be contained
+    in or be similar to one of the fields and results are ranked by their
+    summed similarity. Both lookups are served by the trigram GIN indexes on
+    the folded columns.
+    """
+    terms = [normalize.Fold(Value(t, output_field=CharField())) for t in terms]
+    condition = reduce(
+        and_,
+        (
+            reduce(
+                or_,
+                (
+                    Q(**{f"{f}__fold__contains": t})
+                    | Q(**{f"{f}__fold__trigram_similar": t})
+                    for f in fields
+                ),
+            )
+            for t in terms
+        ),
+    )
+    similarities = [
+        [TrigramSimilarity(normalize.Fold(f), t) for f in fields] for t in terms
+    ]
+    similarity = reduce(
+        add, (Greatest(*s) if len(s) > 1 else s[0] for s in similarities)
+    )
+    return (
+        queryset.filter(condition)
+        .annotate(similarity=similarity)
+        .order_by("-similarity", *queryset.model._meta.ordering)
+    )
+
+
+class RoomFilter(filterset.FilterSet):
+    """
+    ## Filters
+
+    To filter for exact value matches:
+
+        ?<fieldname>=<value>
+
+    To search for rooms by title or full name, ignoring case, accents and
+    umlaut spelling:
+
+        ?name=<name>
+    """
+
+    name = CharFilter(method="filter_name", label="Name")
+
+    class Meta:
+        model = models.Room
+        fields = ("category",)
+
+    def filter_name(self, queryset, name, value):
+        if len(value) < settings.CAMPUSONLINE_NAME_FILTER_MIN_LENGHT:
+            return queryset.none()
+        return search_names(queryset, value.split(), ("title", "name_full"))
+
+
 class FunctionFilter(filterset.FilterSet):
     """
     ## Filters
@@ -212,6 +329,11 @@ class PersonFilter(filterset.FilterSet):
       - `title`: `iexact`, `contains`, `icontains`, `isnull`, `regex`, `iregex`
       - `consultation`: `contains`, `icontains`, `isnull`, `regex`, `iregex`
       - `appendix`: `contains`, `icontains`, `isnull`, `regex`, `iregex`
+
+    To search for persons by name, tolerating typos, ignoring case, accents
+    and umlaut spelling and ranked by similarity:
+
+        ?name=<name>
     """
 
     sex = filters.ChoiceFilter(label=_("Sex"), choices=models.Person.GENDER_CHOICES)
@@ -270,10 +392,8 @@ class PersonFilter(filterset.FilterSet):
 
     def filter_name(self, queryset, name, value):
         if len(value) < settings.CAMPUSONLINE_NAME_FILTER_MIN_LENGHT:
-            return queryset.empty()
-        return queryset.filter(
-            Q(first_name__icontains=value) | Q(last_name__icontains=value)
-        )
+            return queryset.none()
+        return search_names(queryset, name_terms(value))
 
 
 class StudentFilter(filterset.FilterSet):
@@ -293,8 +413,15 @@ class StudentFilter(filterset.FilterSet):
       - `first_name`: `iexact`, `contains`, `icontains`, `startswith`, `istartswith`, `endswith`, `iendswith`, `isnull`, `regex`, `iregex`
       - `last_name`: `iexact`, `contains`, `icontains`, `startswith`, `istartswith`, `endswith`, `iendswith`, `isnull`, `regex`, `iregex`
       - `title`: `iexact`, `contains`, `icontains`, `isnull`, `regex`, `iregex`
+
+    To search for students by name, tolerating typos, ignoring case, accents
+    and umlaut spelling and ranked by similarity:
+
+        ?name=<name>
     """
 
+    name = CharFilter(method="filter_name", label="Name")
+
     class Meta:
         model = models.Student
         fields = {
@@ -335,6 +462,11 @@ class StudentFilter(filterset.FilterSet):
             ),
         }
 
+    def filter_name(self, queryset, name, value):
+        if len(value) < settings.CAMPUSONLINE_NAME_FILTER_MIN_LENGHT:
+            return queryset.none()
+        return search_names(queryset, name_terms(value))
+
 
 class PersonOrganizationFunctionFilter(filterset.FilterSet):
     """
@@ -1,17 +1,103 @@
+from django.core.exceptions import FieldDoesNotExist
 from outpost.django.base.key_constructors import AuthenticatedKeyBit
+from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
+)
 from rest_framework_extensions.key_constructor import bits
 from rest_framework_extensions.key_constructor.constructors import DefaultKeyConstructor
 
+from . import refresh
 
-class PersonKeyConstructor(DefaultKeyConstructor):
-    authenticated = AuthenticatedKeyBit()
-    unique_view_id = bits.UniqueMethodIdKeyBit()
-    format = bits.FormatKeyBit()
-    route = bits.QueryParamsKeyBit()
+
+def relation_models(model, field):
+    """
+    Related model and intermediate model of a many-to-many or reverse relation
+    rendered by a serializer field, e.g. as a list of primary keys.
+    """
+    if field.source == "*" or not field.source_attrs:
+        return set()
+    try:
+        model_field = model._meta.get_field(field.source_attrs[0])
+    except FieldDoesNotExist:
+        return set()
+    if not model_field.is_relation:
+        return set()
+    if model_field.concrete and not model_field.many_to_many:
+        return set()
+    models = {model_field.related_model}
+    if model_field.many_to_many:
+        if model_field.concrete:
+            models.add(model_field.remote_field.through)
+        else:
+            models.add(model_field.through)
+    return models
+
+
+def serializer_models(serializer):
+    """
+    Collect all models rendered by a serializer and its nested serializers,
+    including the related and intermediate models of many-to-many and reverse
+    relations.
+    """
+    meta = getattr(serializer, "Meta", None)
+    model = getattr(meta, "model", None)
+    models = {model} if model is not None else set()
+    for field in serializer.fields.values():
+        if model is not None:
+            models |= relation_models(model, field)
+        if isinstance(field, ListSerializer):
+            field = field.child
+        if isinstance(field, BaseSerializer):
+            models |= serializer_models(field)
+    return models
+
+
+def serializer_generations(serializer):
+    """
+    Refresh generations of all models rendered by a serializer whose refreshes
+    are signaled, keyed by model label.
+    """
+    models = [m for m in serializer_models(serializer) if refresh.signaled(m)]
+    return {
+        m._meta.label_lower: refresh.generation(m)
+        for m in sorted(models, key=lambda m: m._meta.label_lower)
+    }
 
 
-class DistributionListKeyConstructor(DefaultKeyConstructor):
+def serializer_signaled(serializer):
+    """
+    Whether the refreshes of all models rendered by a serializer are signaled,
+    so their refresh generations cover every change of the rendered data.
+    """
+    return all(refresh.signaled(m) for m in serializer_models(serializer))
+
+
+class RefreshGenerationKeyBit(bits.KeyBitBase):
+    """
+    Refresh generations of all models rendered by the view, so cached
+    responses are invalidated as soon as one of their materialized views is
+    refreshed. Models without signaled refreshes are left to the timeout of
+    the cache.
+    """
+
+    def get_data(self, params, view_instance, view_method, request, args, kwargs):
+        generations = serializer_generations(view_instance.get_serializer())
+        return {label: str(g) for label, g in generations.items()}
+
+
+class RefreshKeyConstructor(DefaultKeyConstructor):
     authenticated = AuthenticatedKeyBit()
     unique_view_id = bits.UniqueMethodIdKeyBit()
     format = bits.FormatKeyBit()
     route = bits.QueryParamsKeyBit()
+    kwargs = bits.KwargsKeyBit()
+    generation = RefreshGenerationKeyBit()
+
+
+class PersonKeyConstructor(RefreshKeyConstructor):
+    pass
+
+
+class DistributionListKeyConstructor(RefreshKeyConstructor):
+    pass
@@ -0,0 +1,50 @@
+from django.contrib.postgres.fields.hstore import KeyTransform
+from django.db.models import Value
+from django.db.models.functions import (
+    Coalesce,
+    NullIf,
+)
+
+from .conf import settings
+
+
+def chain(request):
+    """
+    Return the languages to try for the `lang` query parameter, starting with
+    the requested one and falling back to the others in the order of
+    `settings.LANGUAGES`, or `None` if no supported language was requested.
+    """
+    if request is None or not hasattr(request, "query_params"):
+        return None
+    code = request.query_params.get("lang")
+    if not code:
+        return None
+    available = [c for c, _ in settings.LANGUAGES]
+    code = code.lower()
+    if code not in available:
+        code = code.split("-")[0]
+        if code not in available:
+            return None
+    return [code] + [c for c in available if c != code]
+
+
+def alias(name):
+    return f"{name}_translation"
+
+
+def translatable(serializer):
+    """
+    Names of the HStore fields of a serializer that are keyed by language code.
+    """
+    return getattr(getattr(serializer, "Meta", None), "translated_fields", ())
+
+
+def projection(name, languages):
+    """
+    Expression extracting the first available language of a HStore column,
+    skipping missing and empty translations like `TranslatedField`.
+    """
+    expressions = [NullIf(KeyTransform(code, name), Value("")) for code in languages]
+    if len(expressions) == 1:
+        return expressions[0]
+    return Coalesce(*expressions)
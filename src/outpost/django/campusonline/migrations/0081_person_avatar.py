@@ -0,0 +1,315 @@
+# Generated by Django 2.2.28 on 2026-10-18 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    ops = [
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_hash_idx;
+            """,
+            """
+            CREATE UNIQUE INDEX campusonline_person_hash_idx ON "public"."campusonline_person" ("hash");
+            """,
+        ),
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_email_idx;
+            """,
+            """
+            CREATE UNIQUE INDEX campusonline_person_email_idx ON "public"."campusonline_person" ("email");
+            """,
+        ),
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_id_idx;
+            """,
+            """
+            CREATE UNIQUE INDEX campusonline_person_id_idx ON "public"."campusonline_person" ("id");
+            """,
+        ),
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_sex_idx;
+            """,
+            """
+            CREATE INDEX campusonline_person_sex_idx ON "public"."campusonline_person" ("sex");
+            """,
+        ),
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_first_name_idx;
+            """,
+            """
+            CREATE INDEX campusonline_person_first_name_idx ON "public"."campusonline_person" ("first_name");
+            """,
+        ),
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_last_name_idx;
+            """,
+            """
+            CREATE INDEX campusonline_person_last_name_idx ON "public"."campusonline_person" ("last_name");
+            """,
+        ),
+        (
+            """
+            DROP INDEX IF EXISTS campusonline_person_employed_idx;
+            """,
+            """
+            CREATE INDEX campusonline_person_employed_idx ON "public"."campusonline_person" ("employed");
+            """,
+        ),
+        (
+            """
+            DROP MATERIALIZED VIEW IF EXISTS "public"."campusonline_person";
+            """,
+            """
+            CREATE MATERIALIZED VIEW "public"."campusonline_person" AS SELECT
+                p.pers_nr::integer AS id,
+                p.pers_vorname AS first_name,
+                p.pers_famnam AS last_name,
+                p.pers_titel AS title,
+                p.pers_sex AS sex,
+                p.pers_benutzername AS username,
+                p.pers_sprechstunde AS consultation,
+                p.pers_zusatz_info AS appendix,
+                p.pers_profilbild AS avatar,
+                p.pers_email AS email,
+                p.raum_nr::integer AS room_id,
+                ppd.content AS avatar_private,
+                CASE
+                    ppd.content
+                WHEN
+                    NULL
+                THEN
+                    NULL
+                ELSE
+                    encode(digest(format('%s-%s-', p.pers_nr, p.pers_benutzername)::bytea || ppd.content, 'sha1'), 'hex')
+                END AS hash,
+                p.tel_nr AS phone,
+                p.mobil_tel_nr AS mobile,
+                CASE
+                    LOWER(p.dv)
+                WHEN
+                    'j'
+                THEN
+                    true
+                ELSE
+                    false
+                END AS employed,
+                p.visitenkarte AS card,
+                p.pers_fax_nummer AS fax,
+                p.pers_externe_telefon_nummer AS phone_external,
+                HSTORE(
+                    array['prefix', 'suffix'],
+                    array[p.akad_grad_vor, p.akad_grad_nach]
+                ) AS academic_title,
+                HSTORE(
+                    array['prefix', 'suffix'],
+                    array[p.sonstiger_titel_vor, p.sonstiger_titel_nach]
+                ) AS miscellaneous_title,
+                HSTORE(
+                    array['prefix', 'suffix'],
+                    array[p.amtstitel_vor, p.amtstitel_nach]
+                ) AS official_title
+            FROM
+                "campusonline"."personen" p
+            LEFT JOIN
+                "campusonline"."personen_profilbilder_daten" ppd
+            ON
+                p.pers_nr::integer = ppd.person_nr::integer
+            WITH DATA;
+            """,
+        ),
+        (
+            """
+            CREATE MATERIALIZED VIEW "public"."campusonline_person_avatar" AS SELECT
+                encode(digest(format('%s-%s-', p.pers_nr, p.pers_benutzername)::bytea || ppd.content, 'sha1'), 'hex') AS hash,
+                p.pers_nr::integer AS person_id,
+                ppd.content AS avatar
+            FROM
+                "campusonline"."personen" p
+            INNER JOIN
+                "campusonline"."personen_profilbilder_daten" ppd
+            ON
+                p.pers_nr::integer = ppd.person_nr::integer
+            WHERE
+                ppd.content IS NOT NULL
+            WITH DATA;
+            """,
+            """
+            DROP MATERIALIZED VIEW IF EXISTS "public"."campusonline_person_avatar";
+            """,
+        ),
+        (
+            """
+            CREATE UNIQUE INDEX campusonline_person_avatar_hash_idx ON "public"."campusonline_person_avatar" ("hash");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_avatar_hash_idx;
+            """,
+        ),
+        (
+            """
+            CREATE UNIQUE INDEX campusonline_person_avatar_person_id_idx ON "public"."campusonline_person_avatar" ("person_id");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_avatar_person_id_idx;
+            """,
+        ),
+        (
+            """
+            CREATE MATERIALIZED VIEW "public"."campusonline_person" AS SELECT
+                p.pers_nr::integer AS id,
+                p.pers_vorname AS first_name,
+                p.pers_famnam AS last_name,
+                p.pers_titel AS title,
+                p.pers_sex AS sex,
+                p.pers_benutzername AS username,
+                p.pers_sprechstunde AS consultation,
+                p.pers_zusatz_info AS appendix,
+                p.pers_profilbild AS avatar,
+                p.pers_email AS email,
+                p.raum_nr::integer AS room_id,
+                pa.hash AS hash,
+                p.tel_nr AS phone,
+                p.mobil_tel_nr AS mobile,
+                CASE
+                    LOWER(p.dv)
+                WHEN
+                    'j'
+                THEN
+                    true
+                ELSE
+                    false
+                END AS employed,
+                p.visitenkarte AS card,
+                p.pers_fax_nummer AS fax,
+                p.pers_externe_telefon_nummer AS phone_external,
+                HSTORE(
+                    array['prefix', 'suffix'],
+                    array[p.akad_grad_vor, p.akad_grad_nach]
+                ) AS academic_title,
+                HSTORE(
+                    array['prefix', 'suffix'],
+                    array[p.sonstiger_titel_vor, p.sonstiger_titel_nach]
+                ) AS miscellaneous_title,
+                HSTORE(
+                    array['prefix', 'suffix'],
+                    array[p.amtstitel_vor, p.amtstitel_nach]
+                ) AS official_title
+            FROM
+                "campusonline"."personen" p
+            LEFT JOIN
+                "public"."campusonline_person_avatar" pa
+            ON
+                p.pers_nr::integer = pa.person_id
+            WITH DATA;
+            """,
+            """
+            DROP MATERIALIZED VIEW IF EXISTS "public"."campusonline_person";
+            """,
+        ),
+        (
+            """
+            CREATE UNIQUE INDEX campusonline_person_hash_idx ON "public"."campusonline_person" ("hash");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_hash_idx;
+            """,
+        ),
+        (
+            """
+            CREATE UNIQUE INDEX campusonline_person_email_idx ON "public"."campusonline_person" ("email");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_email_idx;
+            """,
+        ),
+        (
+            """
+            CREATE UNIQUE INDEX campusonline_person_id_idx ON "public"."campusonline_person" ("id");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_id_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_person_sex_idx ON "public"."campusonline_person" ("sex");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_sex_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_person_first_name_idx ON "public"."campusonline_person" ("first_name");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_first_name_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_person_last_name_idx ON "public"."campusonline_person" ("last_name");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_last_name_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_person_employed_idx ON "public"."campusonline_person" ("employed");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_employed_idx;
+            """,
+        ),
+    ]
+
+    dependencies = [
+        ("campusonline", "0080_add_multilingual_floor_name"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    [forward for forward, reverse in ops],
+                    [reverse for forward, reverse in reversed(ops)],
+                )
+            ],
+            state_operations=[
+                migrations.CreateModel(
+                    name="PersonAvatar",
+                    fields=[
+                        (
+                            "hash",
+                            models.CharField(
+                                max_length=64, primary_key=True, serialize=False
+                            ),
+                        ),
+                        ("avatar", models.BinaryField()),
+                        (
+                            "person",
+                            models.OneToOneField(
+                                db_constraint=False,
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="avatar_private",
+                                to="campusonline.Person",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "campusonline_person_avatar",
+                        "managed": False,
+                    },
+                ),
+            ],
+        )
+    ]
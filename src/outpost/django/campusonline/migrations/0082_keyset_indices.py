@@ -0,0 +1,61 @@
+# Generated by Django 2.2.28 on 2026-10-18 10:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    ops = [
+        (
+            """
+            CREATE INDEX campusonline_person_keyset_idx ON "public"."campusonline_person" (COALESCE("last_name", ''), "first_name", "id");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_keyset_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_student_keyset_idx ON "public"."campusonline_student" ("last_name", "first_name", "id");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_student_keyset_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_coursegroupterm_keyset_idx ON "public"."campusonline_coursegroupterm" ("start", "end", "id");
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_coursegroupterm_keyset_idx;
+            """,
+        ),
+    ]
+
+    dependencies = [
+        ("campusonline", "0081_person_avatar"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [forward for forward, reverse in ops],
+            [reverse for forward, reverse in reversed(ops)],
+        ),
+        migrations.AlterModelOptions(
+            name="coursegroupterm",
+            options={
+                "get_latest_by": "start",
+                "managed": False,
+                "ordering": ("start", "end", "id"),
+                "permissions": (),
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="person",
+            options={"managed": False, "ordering": ("last_name", "first_name", "id")},
+        ),
+        migrations.AlterModelOptions(
+            name="student",
+            options={"managed": False, "ordering": ("last_name", "first_name", "id")},
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 2.2.28 on 2026-10-18 12:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campusonline", "0082_keyset_indices"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Document",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=64)),
+                ("key", models.CharField(max_length=128)),
+                ("authenticated", models.BooleanField()),
+                ("body", models.TextField()),
+            ],
+            options={
+                "unique_together": {("model", "authenticated", "key")},
+            },
+        ),
+    ]
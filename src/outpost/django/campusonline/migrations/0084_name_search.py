@@ -0,0 +1,87 @@
+# Generated by Django 2.2.28 on 2026-10-18 14:12
+
+from django.contrib.postgres.operations import (
+    TrigramExtension,
+    UnaccentExtension,
+)
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    ops = [
+        (
+            """
+            CREATE OR REPLACE FUNCTION "public"."campusonline_fold"(text) RETURNS text AS $$
+                SELECT public.unaccent(
+                    'public.unaccent'::regdictionary,
+                    replace(replace(replace(replace(lower($1), 'ä', 'ae'), 'ö', 'oe'), 'ü', 'ue'), 'ß', 'ss')
+                )
+            $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+            """,
+            """
+            DROP FUNCTION IF EXISTS "public"."campusonline_fold"(text);
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_person_first_name_fold_trgm_idx ON "public"."campusonline_person" USING gin (campusonline_fold("first_name") gin_trgm_ops);
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_first_name_fold_trgm_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_person_last_name_fold_trgm_idx ON "public"."campusonline_person" USING gin (campusonline_fold("last_name") gin_trgm_ops);
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_person_last_name_fold_trgm_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_student_first_name_fold_trgm_idx ON "public"."campusonline_student" USING gin (campusonline_fold("first_name") gin_trgm_ops);
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_student_first_name_fold_trgm_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_student_last_name_fold_trgm_idx ON "public"."campusonline_student" USING gin (campusonline_fold("last_name") gin_trgm_ops);
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_student_last_name_fold_trgm_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_room_title_fold_trgm_idx ON "public"."campusonline_room" USING gin (campusonline_fold("title") gin_trgm_ops);
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_room_title_fold_trgm_idx;
+            """,
+        ),
+        (
+            """
+            CREATE INDEX campusonline_room_name_full_fold_trgm_idx ON "public"."campusonline_room" USING gin (campusonline_fold("name_full") gin_trgm_ops);
+            """,
+            """
+            DROP INDEX IF EXISTS campusonline_room_name_full_fold_trgm_idx;
+            """,
+        ),
+    ]
+
+    dependencies = [
+        ("campusonline", "0083_document"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunSQL(
+            [forward for forward, reverse in ops],
+            [reverse for forward, reverse in reversed(ops)],
+        ),
+    ]
@@ -0,0 +1,591 @@
+import csv
+from hashlib import sha256
+from io import StringIO
+from itertools import islice
+from tempfile import SpooledTemporaryFile
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.models import (
+    Prefetch,
+    prefetch_related_objects,
+)
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.http import (
+    http_date,
+    quote_etag,
+)
+from rest_framework.relations import ManyRelatedField
+from rest_framework.response import Response
+from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
+)
+from rest_framework_extensions.cache.decorators import CacheResponse
+from rest_framework_extensions.cache.mixins import BaseCacheResponseMixin
+
+from . import (
+    columnar,
+    compression,
+    key_constructors,
+    languages,
+    models,
+    rows,
+)
+from .conf import settings
+from .renderers import (
+    ArrowStreamRenderer,
+    ColumnarRenderer,
+    CSVRenderer,
+    NDJSONRenderer,
+    ORJSONRenderer,
+    ParquetRenderer,
+    orjson,
+)
+
+
+def plan_serializer(model, serializer, prefix=""):
+    """
+    Derive the related lookups and columns needed to render a serializer.
+
+    Walks the fields of the serializer instance, including relations expanded
+    through `expand`, and returns a tuple of `select_related` lookups,
+    `Prefetch` objects and a set of columns for `only()`, all relative to the
+    root model by way of `prefix`.
+
+    Forward relations rendered by nested serializers and reverse one-to-one
+    relations are joined, reverse and many-to-many relations are prefetched
+    with a queryset planned for the nested serializer. Serializers using
+    method fields have to map each of them to the columns it reads in
+    `Meta.extra_columns`, otherwise the column set is `None` and all columns
+    of that model are loaded. Columns of method fields removed through
+    `fields` or `omit` are not loaded.
+    """
+    opts = model._meta
+    select = []
+    prefetch = []
+    columns = {f"{prefix}{opts.pk.name}"}
+    restricted = True
+    extra = getattr(getattr(serializer, "Meta", None), "extra_columns", {})
+    for field in serializer.fields.values():
+        if field.source == "*":
+            if field.field_name in extra:
+                columns.update(f"{prefix}{c}" for c in extra[field.field_name])
+            else:
+                restricted = False
+            continue
+        attr = field.source_attrs[0]
+        path = f"{prefix}{attr}"
+        try:
+            model_field = opts.get_field(attr)
+        except FieldDoesNotExist:
+            restricted = False
+            continue
+        if not model_field.is_relation:
+            columns.add(path)
+            continue
+        related = model_field.related_model
+        if model_field.many_to_many or model_field.one_to_many:
+            if isinstance(field, ListSerializer):
+                queryset = apply_plan(
+                    related._base_manager.all(),
+                    field.child,
+                    restrict=model_field.many_to_many,
+                )
+            elif isinstance(field, ManyRelatedField) and model_field.many_to_many:
+                queryset = related._base_manager.only(related._meta.pk.name)
+            else:
+                queryset = related._base_manager.all()
+            prefetch.append(Prefetch(path, queryset=queryset))
+            continue
+        joined = isinstance(field, BaseSerializer) or len(field.source_attrs) > 1
+        if model_field.concrete:
+            columns.add(path)
+        else:
+            # Reverse one-to-one relations are joined as well, with the columns
+            # Django needs to attach the related object.
+            joined = True
+            columns.add(f"{path}__{related._meta.pk.name}")
+            columns.add(f"{path}__{model_field.field.name}")
+        if joined:
+            select.append(path)
+        if isinstance(field, BaseSerializer):
+            child_select, child_prefetch, child_columns = plan_serializer(
+                related, field, f"{path}__"
+            )
+            select.extend(child_select)
+            prefetch.extend(child_prefetch)
+            if child_columns is not None:
+                columns.update(child_columns)
+    return select, prefetch, columns if restricted else None
+
+
+def ordering_columns(queryset, annotations=True):
+    """
+    Columns a queryset is ordered by, skipping expressions and optionally
+    annotations.
+    """
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    columns = [o.lstrip("-") for o in ordering if isinstance(o, str) and o != "?"]
+    if annotations:
+        return columns
+    return [c for c in columns if c not in queryset.query.annotations]
+
+
+def apply_plan(queryset, serializer, restrict=True):
+    select, prefetch, columns = plan_serializer(queryset.model, serializer)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if restrict and columns is not None:
+        columns.update(
+            c for c in ordering_columns(queryset, annotations=False) if "__" not in c
+        )
+        queryset = queryset.only(*columns)
+    return queryset
+
+
+class LanguageProjectionMixin:
+    """
+    Project the translated HStore columns of the serializer to the language
+    selected by the `lang` query parameter in SQL, falling back to the other
+    languages in the order of `settings.LANGUAGES`. The full HStore columns
+    are not loaded.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        chain = languages.chain(getattr(self, "request", None))
+        if not chain:
+            return queryset
+        serializer = self.get_serializer()
+        names = [
+            n for n in languages.translatable(serializer) if n in serializer.fields
+        ]
+        if not names:
+            return queryset
+        return queryset.annotate(
+            **{languages.alias(n): languages.projection(n, chain) for n in names}
+        ).defer(*names)
+
+
+class ORJSONRendererMixin:
+    """
+    Render JSON with `ORJSONRenderer` by default if `orjson` is installed.
+    """
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if orjson is None:
+            return renderers
+        return [ORJSONRenderer()] + renderers
+
+
+class SerializerRelatedMixin:
+    """
+    Adapt the queryset of a viewset to the serializer that renders it.
+
+    Nested serializers, including those expanded through `expand` on
+    `FlexFieldsMixin` viewsets, are joined or prefetched and only the
+    columns actually rendered are selected.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if getattr(self, "request", None) is None:
+            return queryset
+        return apply_plan(queryset, self.get_serializer())
+
+
+class DocumentMixin:
+    """
+    Render objects from the documents built when their materialized views are
+    refreshed instead of serializing them on each request.
+
+    Filtering, ordering and pagination still operate on the queryset, which
+    only loads the columns needed for them. The rendered documents are joined
+    into the response body as they are. Requests for other formats or
+    indented output, using `expand`, `fields` or `omit` and pages containing
+    objects without a document are serialized as usual.
+    """
+
+    document_params = ("expand", "fields", "omit", "lang")
+    document_placeholder = "\x00"
+
+    def use_documents(self, request):
+        if not settings.CAMPUSONLINE_DOCUMENTS:
+            return False
+        renderer = request.accepted_renderer
+        if renderer.format != "json":
+            return False
+        if renderer.get_indent(request.accepted_media_type, {}):
+            return False
+        return not any(p in request.query_params for p in self.document_params)
+
+    def get_documents(self, model, keys):
+        return dict(
+            models.Document.objects.filter(
+                model=model._meta.label_lower,
+                authenticated=self.request.user.is_authenticated,
+                key__in=keys,
+            ).values_list("key", "body")
+        )
+
+    def document_response(self, request, content):
+        return HttpResponse(content, content_type=request.accepted_renderer.media_type)
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_documents(request):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        columns = {queryset.model._meta.pk.name}
+        columns.update(
+            c for c in ordering_columns(queryset, annotations=False) if "__" not in c
+        )
+        queryset = (
+            queryset.select_related(None).prefetch_related(None).only(*columns)
+        )
+        page = self.paginate_queryset(queryset)
+        keys = [str(o.pk) for o in (queryset if page is None else page)]
+        documents = self.get_documents(queryset.model, keys)
+        if len(documents) < len(keys):
+            return super().list(request, *args, **kwargs)
+        content = ("[" + ",".join(documents[k] for k in keys) + "]").encode("utf-8")
+        if page is not None:
+            # Render the envelope of the paginator around a placeholder, which
+            # no URL or count can contain, and put the documents in its place.
+            renderer = request.accepted_renderer
+            envelope = self.get_paginated_response(self.document_placeholder).data
+            content = renderer.render(envelope).replace(
+                renderer.render(self.document_placeholder), content, 1
+            )
+        return self.document_response(request, content)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.use_documents(request):
+            return super().retrieve(request, *args, **kwargs)
+        instance = self.get_object()
+        key = str(instance.pk)
+        documents = self.get_documents(instance._meta.model, [key])
+        if key not in documents:
+            return super().retrieve(request, *args, **kwargs)
+        return self.document_response(request, documents[key].encode("utf-8"))
+
+
+class ValuesListMixin:
+    """
+    Render lists from `QuerySet.values()` rows instead of model instances.
+
+    The serializer is compiled into the columns it reads and a function
+    building the same representation from plain rows, skipping model
+    instantiation and the per-field overhead of serializers. Serializers with
+    fields that cannot be compiled and other formats than JSON are rendered
+    as usual.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != "json":
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            plan = rows.Plan(queryset.model, self.get_serializer())
+        except rows.Unsupported:
+            return super().list(request, *args, **kwargs)
+        columns = plan.columns + ordering_columns(queryset)
+        queryset = (
+            queryset.select_related(None)
+            .prefetch_related(None)
+            .values(*dict.fromkeys(columns))
+        )
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(plan.render(list(queryset)))
+        return self.get_paginated_response(plan.render(page))
+
+
+def chunked(queryset, size):
+    """
+    Iterate over a queryset using a server-side cursor, applying its
+    prefetches chunk by chunk as `QuerySet.iterator()` ignores them.
+    """
+    lookups = queryset._prefetch_related_lookups
+    iterator = queryset.iterator(chunk_size=size)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        if lookups:
+            prefetch_related_objects(chunk, *lookups)
+        yield chunk
+
+
+class StreamingListMixin:
+    """
+    Stream the complete filtered list as newline delimited JSON when
+    requested with `?format=ndjson`, bypassing pagination.
+
+    Memory usage is bounded by `CAMPUSONLINE_STREAM_CHUNK_SIZE` regardless of
+    the size of the list.
+    """
+
+    def get_renderers(self):
+        return super().get_renderers() + [NDJSONRenderer()]
+
+    def stream(self, queryset):
+        renderer = self.request.accepted_renderer
+        for chunk in chunked(queryset, settings.CAMPUSONLINE_STREAM_CHUNK_SIZE):
+            for item in self.get_serializer(chunk, many=True).data:
+                yield renderer.line(item)
+
+    def list(self, request, *args, **kwargs):
+        if not isinstance(request.accepted_renderer, NDJSONRenderer):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.stream(queryset), content_type=request.accepted_renderer.media_type
+        )
+
+
+class ColumnarExportMixin:
+    """
+    Export the complete filtered list as an Arrow IPC stream or Parquet file
+    when requested with `?format=arrow` or `?format=parquet`.
+
+    Columns are those of the serializer that maps directly to model fields,
+    read in record batches of `CAMPUSONLINE_STREAM_CHUNK_SIZE` rows from a
+    server-side cursor. Only available if `pyarrow` is installed.
+    """
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if columnar.pyarrow is None:
+            return renderers
+        return renderers + [ArrowStreamRenderer(), ParquetRenderer()]
+
+    def list(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        if not isinstance(renderer, ColumnarRenderer):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        columns = list(
+            columnar.serializer_columns(queryset.model, self.get_serializer())
+        )
+        batches = columnar.record_batches(
+            queryset, columns, settings.CAMPUSONLINE_STREAM_CHUNK_SIZE
+        )
+        response = StreamingHttpResponse(
+            renderer.stream(columnar.schema(columns), batches),
+            content_type=renderer.media_type,
+        )
+        name = queryset.model._meta.model_name
+        response["Content-Disposition"] = (
+            f'attachment; filename="{name}.{renderer.format}"'
+        )
+        return response
+
+
+class CSVExportMixin:
+    """
+    Export the complete filtered list as CSV when requested with
+    `?format=csv`.
+
+    The queryset is compiled to SQL and handed to PostgreSQL
+    `COPY ... TO STDOUT`, so neither models nor serializers are involved. The
+    exported columns are taken from `csv_columns` which may span relations,
+    defaulting to the serializer fields mapping directly to model columns.
+    """
+
+    csv_columns = None
+
+    def get_renderers(self):
+        return super().get_renderers() + [CSVRenderer()]
+
+    def get_csv_columns(self, queryset):
+        if self.csv_columns is not None:
+            return self.csv_columns
+        return tuple(
+            field.name
+            for _, field in columnar.serializer_columns(
+                queryset.model, self.get_serializer()
+            )
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not isinstance(request.accepted_renderer, CSVRenderer):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        columns = self.get_csv_columns(queryset)
+        rows = queryset.prefetch_related(None).values_list(*columns)
+        sql, params = rows.query.sql_with_params()
+        header = StringIO()
+        csv.writer(header, lineterminator="\n").writerow(
+            [c.replace("__", ".") for c in columns]
+        )
+        sink = SpooledTemporaryFile(max_size=settings.CAMPUSONLINE_CSV_SPOOL_SIZE)
+        sink.write(header.getvalue().encode("utf-8"))
+        with connections[rows.db].cursor() as cursor:
+            query = cursor.mogrify(sql, params).decode("utf-8")
+            cursor.copy_expert(
+                f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, ENCODING 'UTF8')", sink
+            )
+        sink.seek(0)
+        name = queryset.model._meta.model_name
+        return FileResponse(
+            sink,
+            as_attachment=True,
+            filename=f"{name}.csv",
+            content_type=request.accepted_renderer.media_type,
+        )
+
+
+class CompressedCacheResponse(CacheResponse):
+    """
+    Cache rendered responses together with their compressed variants and
+    answer with the one matching the `Accept-Encoding` of the request, so
+    bodies are compressed once per cache entry instead of once per request.
+    """
+
+    def process_cache_response(
+        self, view_instance, view_method, request, args, kwargs
+    ):
+        key = self.calculate_key(
+            view_instance=view_instance,
+            view_method=view_method,
+            request=request,
+            args=args,
+            kwargs=kwargs,
+        )
+        entry = self.cache.get(key)
+        if not entry:
+            response = view_method(view_instance, request, *args, **kwargs)
+            response = view_instance.finalize_response(
+                request, response, *args, **kwargs
+            )
+            if hasattr(response, "render"):
+                response.render()
+            if response.status_code >= 400 and not self.cache_errors:
+                return response
+            headers = {k: (k, v) for k, v in response.items()}
+            entry = (
+                compression.compress(response.content),
+                response.status_code,
+                headers,
+            )
+            timeout = self.calculate_timeout(view_instance=view_instance)
+            self.cache.set(key, entry, timeout)
+        bodies, status, headers = entry
+        response = HttpResponse(status=status)
+        for k, v in headers.values():
+            response[k] = v
+        return compression.apply(response, request, bodies)
+
+    def calculate_timeout(self, view_instance, **kwargs):
+        # Resolved per request, as the base class replaces `timeout` with the
+        # first value it resolves.
+        timeout = self.timeout
+        if isinstance(timeout, str):
+            timeout = getattr(view_instance, timeout)
+        if callable(timeout):
+            timeout = timeout()
+        return timeout
+
+
+class RefreshCacheResponseMixin(BaseCacheResponseMixin):
+    """
+    Cache responses until the materialized views of the rendered models are
+    refreshed, as tracked by their refresh generation.
+
+    Responses also rendering models whose refreshes are not signaled expire
+    after `CAMPUSONLINE_UNSIGNALED_CACHE_TIMEOUT` instead. Cached bodies are
+    stored with their gzip and brotli encoded variants.
+    """
+
+    object_cache_key_func = key_constructors.RefreshKeyConstructor()
+    list_cache_key_func = key_constructors.RefreshKeyConstructor()
+
+    def get_cache_timeout(self):
+        if key_constructors.serializer_signaled(self.get_serializer()):
+            return settings.CAMPUSONLINE_RESPONSE_CACHE_TIMEOUT
+        return settings.CAMPUSONLINE_UNSIGNALED_CACHE_TIMEOUT
+
+    @CompressedCacheResponse(
+        key_func="object_cache_key_func", timeout="get_cache_timeout"
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @CompressedCacheResponse(
+        key_func="list_cache_key_func", timeout="get_cache_timeout"
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class ConditionalMixin:
+    """
+    Answer conditional requests based on the refresh generations of the
+    rendered models.
+
+    Responses carry a weak `ETag` derived from the same bits as the response
+    cache key and a `Last-Modified` header with the time of the latest refresh.
+    Matching `If-None-Match` or `If-Modified-Since` headers are answered with
+    `304 Not Modified` without evaluating the queryset.
+
+    If some of the rendered models have no signaled refreshes, the response is
+    rendered and only carries an `ETag` derived from its content.
+    """
+
+    etag_func = key_constructors.RefreshKeyConstructor()
+
+    def get_last_modified(self):
+        generations = key_constructors.serializer_generations(self.get_serializer())
+        if not generations:
+            return None
+        return int(max(generations.values()))
+
+    def conditional(self, handler, request, *args, **kwargs):
+        if not key_constructors.serializer_signaled(self.get_serializer()):
+            return self.conditional_content(handler, request, *args, **kwargs)
+        key = self.etag_func(
+            view_instance=self,
+            view_method=handler,
+            request=request,
+            args=args,
+            kwargs=kwargs,
+        )
+        etag = f"W/{quote_etag(key)}"
+        last_modified = self.get_last_modified()
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def conditional_content(self, handler, request, *args, **kwargs):
+        response = handler(request, *args, **kwargs)
+        if response.status_code != 200 or response.streaming:
+            return response
+        response = self.finalize_response(request, response, *args, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        etag = f"W/{quote_etag(sha256(response.content).hexdigest())}"
+        response = get_conditional_response(request, etag=etag, response=response)
+        response["ETag"] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
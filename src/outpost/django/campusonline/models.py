@@ -1,5 +1,6 @@
 import logging
 from io import BytesIO
+from itertools import product
 from locale import (
     LC_ALL,
     LC_CTYPE,
@@ -11,6 +12,7 @@ import django
 import requests
 from django.contrib.gis.db import models
 from django.contrib.postgres.fields import HStoreField
+from django.core.cache import caches
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from ordered_model.models import OrderedModel
@@ -26,7 +28,10 @@ from PyQt5.QtCore import (
     QRectF,
 )
 from treebeard.al_tree import AL_Node
+from wand.exceptions import WandException
+from wand.image import Image as WandImage
 
+from . import refresh
 from .conf import settings
 
 logger = logging.getLogger(__name__)
@@ -421,7 +426,6 @@ class Person(models.Model):
         db_constraint=False,
         related_name="persons_leave",
     )
-    avatar_private = models.BinaryField()
     hash = models.CharField(max_length=64)
     phone = models.CharField(max_length=256, blank=True, null=True)
     mobile = models.CharField(max_length=256, blank=True, null=True)
@@ -436,7 +440,7 @@ class Person(models.Model):
     class Meta:
         managed = False
         db_table = "campusonline_person"
-        ordering = ("last_name", "first_name")
+        ordering = ("last_name", "first_name", "id")
 
     class Refresh:
         interval = 1800
@@ -445,6 +449,102 @@ class Person(models.Model):
         return "{s.last_name}, {s.first_name}".format(s=self)
 
 
+class PersonAvatar(models.Model):
+    """
+    Private avatar image of a person, kept out of the person view so its
+    refresh does not have to rewrite image data.
+
+    The hash changes with the image content, so rendered variants are
+    immutable and cached by hash, size and format.
+    """
+
+    MIMETYPES = {"jpeg": "image/jpeg", "webp": "image/webp", "avif": "image/avif"}
+
+    hash = models.CharField(max_length=64, primary_key=True)
+    person = models.OneToOneField(
+        "Person",
+        models.DO_NOTHING,
+        db_constraint=False,
+        related_name="avatar_private",
+    )
+    avatar = models.BinaryField()
+
+    class Meta:
+        managed = False
+        db_table = "campusonline_person_avatar"
+
+    class Refresh:
+        interval = 86400
+
+    def __str__(self):
+        return self.hash
+
+    @staticmethod
+    def variant_key(hash, size, fmt):
+        return f"campusonline:avatar:{hash}:{size or 'full'}:{fmt}"
+
+    @staticmethod
+    def variants():
+        return product(
+            (None,) + tuple(settings.CAMPUSONLINE_AVATAR_SIZES),
+            settings.CAMPUSONLINE_AVATAR_FORMATS,
+        )
+
+    @classmethod
+    def variant(cls, hash, size=None, fmt="jpeg") -> bytes:
+        cache = caches[settings.CAMPUSONLINE_AVATAR_CACHE]
+        key = cls.variant_key(hash, size, fmt)
+        body = cache.get(key)
+        if body is None:
+            body = cls.objects.get(hash=hash).render(size, fmt)
+            cache.set(key, body, settings.CAMPUSONLINE_AVATAR_CACHE_TIMEOUT)
+        return body
+
+    @classmethod
+    def variant_many(cls, hashes, size=None, fmt="jpeg") -> dict:
+        cache = caches[settings.CAMPUSONLINE_AVATAR_CACHE]
+        timeout = settings.CAMPUSONLINE_AVATAR_CACHE_TIMEOUT
+        keys = {cls.variant_key(h, size, fmt): h for h in hashes}
+        bodies = {keys[k]: v for k, v in cache.get_many(keys).items()}
+        missing = set(hashes) - set(bodies)
+        if not missing:
+            return bodies
+        rendered = dict()
+        for a in cls.objects.filter(hash__in=missing):
+            try:
+                rendered[a.hash] = a.render(size, fmt)
+            except WandException as e:
+                logger.warn(f"Could not render avatar {a} as {fmt}: {e}")
+        cache.set_many(
+            {cls.variant_key(h, size, fmt): b for h, b in rendered.items()}, timeout
+        )
+        bodies.update(rendered)
+        return bodies
+
+    def render(self, size=None, fmt="jpeg") -> bytes:
+        with WandImage(blob=self.avatar.tobytes()) as img:
+            if size and max(img.size) > size:
+                ratio = size / max(img.size)
+                img.resize(
+                    max(1, round(img.width * ratio)), max(1, round(img.height * ratio))
+                )
+            img.format = fmt
+            return img.make_blob()
+
+    def prerender(self):
+        rendered = dict()
+        for size, fmt in self.variants():
+            try:
+                rendered[self.variant_key(self.hash, size, fmt)] = self.render(
+                    size, fmt
+                )
+            except WandException as e:
+                logger.warn(f"Could not render avatar {self} as {fmt}: {e}")
+        caches[settings.CAMPUSONLINE_AVATAR_CACHE].set_many(
+            rendered, settings.CAMPUSONLINE_AVATAR_CACHE_TIMEOUT
+        )
+
+
 class External(models.Model):
     """
     ## Fields
@@ -596,7 +696,7 @@ class Student(models.Model):
     class Meta:
         managed = False
         db_table = "campusonline_student"
-        ordering = ("last_name", "first_name")
+        ordering = ("last_name", "first_name", "id")
 
     class Refresh:
         interval = 7200
@@ -675,7 +775,7 @@ class CourseGroupTerm(models.Model):
         managed = False
         db_table = "campusonline_coursegroupterm"
         get_latest_by = "start"
-        ordering = ("start", "end")
+        ordering = ("start", "end", "id")
         permissions = (
             (("view_coursegroupterm", _("Can view course group term")),)
             if django.VERSION < (2, 1)
@@ -891,6 +991,27 @@ class BulletinPage(models.Model):
         self.text = scanned
 
 
+class Document(models.Model):
+    """
+    Serialized representation of a single object, built when the materialized
+    views it is rendered from are refreshed.
+
+    The body is stored as rendered JSON text, as `jsonb` would not preserve
+    the order of keys.
+    """
+
+    model = models.CharField(max_length=64)
+    key = models.CharField(max_length=128)
+    authenticated = models.BooleanField()
+    body = models.TextField()
+
+    class Meta:
+        unique_together = ("model", "authenticated", "key")
+
+    def __str__(self):
+        return f"{self.model}:{self.key}"
+
+
 class FinalThesis(models.Model):
     study_designation = models.CharField(max_length=256)
     modified = models.DateTimeField()
@@ -1143,3 +1264,8 @@ class ScienceBranch(AL_Node):
 
     def __str__(self):
         return self.code
+
+
+materialized_view_refreshed.connect(
+    refresh.refreshed, sender=MaterializedViewTasks.refresh
+)
@@ -0,0 +1,37 @@
+import unicodedata
+
+from django.db.models import (
+    CharField,
+    TextField,
+    Transform,
+)
+
+umlauts = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def fold(value):
+    """
+    Lowercase, expand German umlauts and strip accents, mirroring the
+    `campusonline_fold` SQL function so search terms can be compared to the
+    folded columns.
+    """
+    if value is None:
+        return ""
+    value = str(value).lower().translate(umlauts)
+    return "".join(
+        c for c in unicodedata.normalize("NFKD", value) if not unicodedata.combining(c)
+    )
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class Fold(Transform):
+    """
+    Folded text as used by the search indexes on the person, student and room
+    views, available as the `fold` transform:
+
+        Person.objects.filter(last_name__fold__contains="mueller")
+    """
+
+    lookup_name = "fold"
+    function = "campusonline_fold"
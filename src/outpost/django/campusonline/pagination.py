@@ -0,0 +1,61 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    CharField,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from rest_framework.pagination import CursorPagination
+
+from .conf import settings
+
+
+class NaturalOrderingCursorPagination(CursorPagination):
+    """
+    Cursor pagination following the natural ordering of the model.
+
+    The cursor is positioned on the leading column of `Meta.ordering` and
+    each model is expected to have a composite index matching its ordering,
+    so deep pages cost the same as the first one. Querysets ranked by an
+    annotation, like fuzzy name searches, keep their ordering instead.
+
+    A nullable leading text column is replaced by an annotation coalescing
+    `NULL` to an empty string, as the cursor position is kept as a string and
+    `NULL` would turn into `"None"`. Its index has to cover the same
+    expression.
+    """
+
+    page_size = settings.CAMPUSONLINE_CURSOR_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.CAMPUSONLINE_CURSOR_MAX_PAGE_SIZE
+
+    def ranked(self, queryset):
+        ordering = queryset.query.order_by
+        return bool(ordering) and ordering[0].lstrip("-") in queryset.query.annotations
+
+    def coalesce(self, queryset):
+        ordering = list(queryset.model._meta.ordering)
+        if not ordering:
+            return queryset
+        name = ordering[0].lstrip("-")
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return queryset
+        if not field.null or not isinstance(field, (CharField, TextField)):
+            return queryset
+        alias = f"{name}_cursor"
+        ordering[0] = ordering[0].replace(name, alias)
+        return queryset.annotate(**{alias: Coalesce(name, Value(""))}).order_by(
+            *ordering
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.ranked(queryset):
+            queryset = self.coalesce(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        if self.ranked(queryset):
+            return queryset.query.order_by
+        return queryset.model._meta.ordering
@@ -0,0 +1,46 @@
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+
+def owner(model):
+    """
+    Model whose materialized view refresh covers `model`, which is the model
+    declaring the relation for auto-created many-to-many tables.
+    """
+    return model._meta.auto_created or model
+
+
+def signaled(model):
+    """
+    Whether refreshes of `model` are signaled, which is only the case for
+    materialized views with a `Refresh` definition.
+    """
+    return hasattr(owner(model), "Refresh")
+
+
+def generation_key(model):
+    return f"campusonline:generation:{owner(model)._meta.label_lower}"
+
+
+def generation(model) -> Optional[float]:
+    """
+    Return the refresh generation of a model, the time of the last refresh
+    of its materialized view, or `None` if its refreshes are not signaled.
+
+    Unknown generations start at the current time so a lost counter can never
+    resurrect stale cache entries.
+    """
+    if not signaled(model):
+        return None
+    key = generation_key(model)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, time.time(), None)
+        value = cache.get(key)
+    return value
+
+
+def refreshed(name, model, **kwargs):
+    cache.set(generation_key(model), time.time(), None)
@@ -0,0 +1,143 @@
+import json
+from io import BytesIO
+
+from django.contrib.gis.geos import GEOSGeometry
+from rest_framework.renderers import (
+    BaseRenderer,
+    JSONRenderer,
+)
+from rest_framework.utils import encoders
+
+from .columnar import pyarrow
+
+if pyarrow is not None:
+    from pyarrow import parquet
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Render data as newline delimited JSON, one document per line.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def line(self, item):
+        return json.dumps(item, cls=encoders.JSONEncoder, ensure_ascii=False) + "\n"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not isinstance(data, list):
+            data = [data]
+        return "".join(self.line(item) for item in data).encode(self.charset)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render JSON through `orjson`, producing the same output as `JSONRenderer`
+    apart from floats.
+
+    Values `orjson` does not handle natively are passed to the DRF encoder,
+    which includes datetimes to keep their format. GEOS geometries are
+    rendered as GeoJSON. Indented, non-compact or ASCII-only output and data
+    `orjson` rejects, like integers exceeding 64 bits, is left to
+    `JSONRenderer`.
+
+    Floats are written in their shortest form without a sign or padding in
+    the exponent, e.g. `1e16` and `1e-7` instead of `1e+16` and `1e-07`, and
+    small values in positional notation, e.g. `0.00001` instead of `1e-05`.
+    Both parse to the same value. `NaN` and infinities are rendered as
+    `null`, where `JSONRenderer` fails in strict mode.
+    """
+
+    encoder = encoders.JSONEncoder()
+
+    def default(self, obj):
+        if isinstance(obj, GEOSGeometry):
+            return json.loads(obj.geojson)
+        return self.encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class CSVRenderer(JSONRenderer):
+    """
+    Marker renderer for CSV exports produced by PostgreSQL `COPY`. Anything
+    else, like error responses, is rendered as JSON.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+
+
+class ColumnarRenderer(JSONRenderer):
+    """
+    Base class for renderers writing Arrow record batches into a binary
+    stream. Anything else, like error responses, is rendered as JSON.
+    """
+
+    def writer(self, sink, schema):
+        raise NotImplementedError()
+
+    def write(self, writer, batch):
+        raise NotImplementedError()
+
+    def drain(self, sink):
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    def stream(self, schema, batches):
+        sink = BytesIO()
+        with self.writer(sink, schema) as writer:
+            for batch in batches:
+                self.write(writer, batch)
+                yield self.drain(sink)
+        yield self.drain(sink)
+
+
+class ArrowStreamRenderer(ColumnarRenderer):
+    media_type = "application/vnd.apache.arrow.stream"
+    format = "arrow"
+
+    def writer(self, sink, schema):
+        return pyarrow.ipc.new_stream(sink, schema)
+
+    def write(self, writer, batch):
+        writer.write_batch(batch)
+
+
+class ParquetRenderer(ColumnarRenderer):
+    media_type = "application/vnd.apache.parquet"
+    format = "parquet"
+
+    def writer(self, sink, schema):
+        return parquet.ParquetWriter(sink, schema)
+
+    def write(self, writer, batch):
+        writer.write_table(pyarrow.Table.from_batches([batch]))
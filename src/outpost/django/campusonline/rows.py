@@ -0,0 +1,137 @@
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields
+from rest_framework.relations import (
+    ManyRelatedField,
+    PrimaryKeyRelatedField,
+)
+from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
+)
+
+VALUE, NESTED, MANY = range(3)
+
+passthrough = {
+    fields.BooleanField.to_representation,
+    fields.CharField.to_representation,
+    fields.IntegerField.to_representation,
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+class Plan:
+    """
+    Serializer compiled into a list of columns for `QuerySet.values()` and a
+    function building the same representation from the resulting rows.
+
+    Supported are fields mapping directly to model columns, primary keys of
+    related objects, including reverse one-to-one relations which are joined,
+    nested serializers on forward relations and lists of primary keys on
+    many-to-many or reverse relations, which are fetched with one additional
+    query each. Any other field raises `Unsupported`.
+    """
+
+    def __init__(self, model, serializer, prefix=""):
+        opts = model._meta
+        self.key = f"{prefix}{opts.pk.name}"
+        self.columns = [self.key]
+        self.entries = []
+        for field in serializer._readable_fields:
+            if field.source == "*" or len(field.source_attrs) != 1:
+                raise Unsupported(field.field_name)
+            attr = field.source_attrs[0]
+            path = f"{prefix}{attr}"
+            try:
+                model_field = opts.get_field(attr)
+            except FieldDoesNotExist:
+                raise Unsupported(field.field_name)
+            if not model_field.is_relation:
+                convert = field.to_representation
+                if getattr(type(field), "to_representation") in passthrough:
+                    convert = None
+                self.add(field.field_name, VALUE, path, convert)
+            elif model_field.many_to_one and model_field.concrete:
+                if isinstance(field, BaseSerializer) and not isinstance(
+                    field, ListSerializer
+                ):
+                    plan = Plan(model_field.related_model, field, f"{path}__")
+                    self.add(field.field_name, NESTED, plan, None)
+                elif isinstance(field, PrimaryKeyRelatedField) and not field.pk_field:
+                    self.add(field.field_name, VALUE, path, None)
+                else:
+                    raise Unsupported(field.field_name)
+            elif model_field.one_to_one and not model_field.concrete:
+                if not (
+                    isinstance(field, PrimaryKeyRelatedField) and not field.pk_field
+                ):
+                    raise Unsupported(field.field_name)
+                self.add(field.field_name, VALUE, f"{path}__pk", None)
+            elif model_field.many_to_many or model_field.one_to_many:
+                child = getattr(field, "child_relation", None)
+                if not (
+                    isinstance(field, ManyRelatedField)
+                    and isinstance(child, PrimaryKeyRelatedField)
+                    and not child.pk_field
+                ):
+                    raise Unsupported(field.field_name)
+                if model_field.concrete:
+                    if model_field.remote_field.is_hidden():
+                        raise Unsupported(field.field_name)
+                    lookup = model_field.related_query_name()
+                else:
+                    lookup = model_field.field.name
+                self.entries.append(
+                    (field.field_name, MANY, model_field.related_model, lookup)
+                )
+            else:
+                raise Unsupported(field.field_name)
+
+    def add(self, name, kind, payload, convert):
+        if kind == NESTED:
+            self.columns.extend(payload.columns)
+        else:
+            self.columns.append(payload)
+        self.entries.append((name, kind, payload, convert))
+
+    def relations(self):
+        for name, kind, payload, extra in self.entries:
+            if kind == MANY:
+                yield self.key, name, payload, extra
+            elif kind == NESTED:
+                yield from payload.relations()
+
+    def fetch(self, rows):
+        related = {}
+        for key, name, model, lookup in self.relations():
+            keys = {row[key] for row in rows} - {None}
+            grouped = defaultdict(list)
+            pairs = model._default_manager.filter(**{f"{lookup}__in": keys})
+            for value, pk in pairs.values_list(lookup, "pk"):
+                grouped[value].append(pk)
+            related[(key, name)] = grouped
+        return related
+
+    def build(self, row, related):
+        result = {}
+        for name, kind, payload, extra in self.entries:
+            if kind == VALUE:
+                value = row[payload]
+                if value is not None and extra is not None:
+                    value = extra(value)
+            elif kind == NESTED:
+                value = None
+                if row[payload.key] is not None:
+                    value = payload.build(row, related)
+            else:
+                value = related[(self.key, name)].get(row[self.key], [])
+            result[name] = value
+        return result
+
+    def render(self, rows):
+        related = self.fetch(rows)
+        return [self.build(row, related) for row in rows]
@@ -21,6 +21,7 @@ class PersonIndex(CelerySearchIndex, indexes.Indexable):
 
     presentation = indexes.CharField(use_template=True)
     autocomplete = indexes.EdgeNgramField(use_template=True)
+    employed = indexes.BooleanField(model_attr="employed")
 
     def get_model(self):
         return models.Person
@@ -1,4 +1,5 @@
 from django.urls import reverse
+from django.utils.functional import cached_property
 from drf_haystack.serializers import HaystackSerializerMixin
 from phonenumbers import (
     PhoneNumberFormat,
@@ -7,26 +8,130 @@ from phonenumbers import (
 from phonenumbers import parse as parse_number
 from phonenumbers import phonenumberutil
 from rest_flex_fields import FlexFieldsModelSerializer
+from rest_framework.fields import HStoreField
 from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
     ModelSerializer,
     PrimaryKeyRelatedField,
     SerializerMethodField,
 )
 
-from . import models
+from . import (
+    languages,
+    models,
+)
 from .conf import settings
 
 
+def prune_fields(fields, include, omit):
+    """
+    Remove fields not named in `include` or named in `omit`, both lists of
+    paths split on dots, descending into nested serializers.
+    """
+    names = {path[0] for path in include}
+    if names:
+        for name in list(fields):
+            if name not in names:
+                del fields[name]
+    for path in omit:
+        if len(path) == 1:
+            fields.pop(path[0], None)
+    for name, field in fields.items():
+        if isinstance(field, ListSerializer):
+            field = field.child
+        if not isinstance(field, BaseSerializer):
+            continue
+        nested_include = [p[1:] for p in include if p[0] == name and len(p) > 1]
+        nested_omit = [p[1:] for p in omit if p[0] == name and len(p) > 1]
+        if nested_include or nested_omit:
+            prune_fields(field.fields, nested_include, nested_omit)
+
+
+class SparseFieldsetMixin:
+    """
+    Restrict the rendered fields through the `fields` and `omit` query
+    parameters. Both take a comma separated list of field names, using dotted
+    paths for fields of nested serializers:
+
+        ?fields=id,start,end,room.name_short
+        ?omit=room.category,course
+
+    Only applies if the serializer is the root of the response.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = getattr(self, "parent", None)
+        if isinstance(parent, ListSerializer):
+            parent = parent.parent
+        request = self.context.get("request")
+        if parent is not None or request is None:
+            return fields
+
+        def paths(param):
+            value = request.query_params.get(param, "")
+            return [p.strip().split(".") for p in value.split(",") if p.strip()]
+
+        prune_fields(fields, paths("fields"), paths("omit"))
+        return fields
+
+
+class TranslatedField(HStoreField):
+    """
+    HStore field rendered as a plain string in the language selected by the
+    `lang` query parameter, either from a projection annotated by the view or
+    by picking the language from the full HStore.
+    """
+
+    @cached_property
+    def languages(self):
+        return languages.chain(self.context.get("request"))
+
+    def get_attribute(self, instance):
+        if self.languages:
+            name = languages.alias(self.source)
+            if hasattr(instance, name):
+                return getattr(instance, name)
+        return super().get_attribute(instance)
+
+    def to_representation(self, value):
+        if not isinstance(value, dict):
+            return value
+        if not self.languages:
+            return super().to_representation(value)
+        for code in self.languages:
+            if value.get(code):
+                return value[code]
+        return None
+
+
+class TranslatedFieldsMixin:
+    """
+    Render the HStore fields keyed by language code listed in
+    `Meta.translated_fields` with `TranslatedField`.
+    """
+
+    def build_standard_field(self, field_name, model_field):
+        field_class, field_kwargs = super().build_standard_field(
+            field_name, model_field
+        )
+        if field_name in languages.translatable(self):
+            field_class = TranslatedField
+        return field_class, field_kwargs
+
+
 class RoomCategorySerializer(ModelSerializer):
     class Meta:
         model = models.RoomCategory
         fields = "__all__"
 
 
-class FloorSerializer(ModelSerializer):
+class FloorSerializer(TranslatedFieldsMixin, ModelSerializer):
     class Meta:
         model = models.Floor
         exclude = ("short",)
+        translated_fields = ("name",)
 
 
 class BuildingSerializer(ModelSerializer):
@@ -35,7 +140,7 @@ class BuildingSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class RoomSerializer(ModelSerializer):
+class RoomSerializer(SparseFieldsetMixin, ModelSerializer):
     category = RoomCategorySerializer()
     floor = FloorSerializer()
     building = BuildingSerializer()
@@ -96,7 +201,7 @@ class OrganizationTypeSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class OrganizationSerializer(FlexFieldsModelSerializer):
+class OrganizationSerializer(TranslatedFieldsMixin, FlexFieldsModelSerializer):
     """
     ## Expansions
 
@@ -151,6 +256,7 @@ class OrganizationSerializer(FlexFieldsModelSerializer):
             "type",
             "university_law",
         )
+        translated_fields = ("name",)
 
 
 class AuthenticatedOrganizationSerializer(OrganizationSerializer):
@@ -289,9 +395,10 @@ class AuthenticatedPersonSerializer(PersonSerializer):
             "organizations_leave",
             "employed",
         )
+        extra_columns = {"avatar": ("hash",), "mobile": ("mobile",)}
 
     def get_avatar(self, obj):
-        if not obj.avatar_private:
+        if not obj.hash:
             return None
         path = reverse("campusonline:avatar-private", kwargs={"hash": obj.hash})
         request = self.context.get("request")
@@ -365,7 +472,7 @@ class DistributionListSerializer(FlexFieldsModelSerializer):
         fields = "__all__"
 
 
-class StudentSerializer(ModelSerializer):
+class StudentSerializer(SparseFieldsetMixin, ModelSerializer):
     class Meta:
         model = models.Student
         fields = ("id", "first_name", "last_name", "title", "avatar")
@@ -393,7 +500,7 @@ class CourseGroupSerializer(ModelSerializer):
         fields = ("id", "course", "name")
 
 
-class CourseGroupTermSerializer(ModelSerializer):
+class CourseGroupTermSerializer(SparseFieldsetMixin, ModelSerializer):
     coursegroup = CourseGroupSerializer()
     person = PersonSerializer()
     room = RoomSerializer()
@@ -412,7 +519,7 @@ class CourseGroupTermSerializer(ModelSerializer):
         )
 
 
-class EventSerializer(ModelSerializer):
+class EventSerializer(SparseFieldsetMixin, ModelSerializer):
     building = BuildingSerializer()
     room = RoomSerializer()
     course = CourseSerializer()
@@ -428,7 +535,7 @@ class BulletinSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class BulletinPageSerializer(ModelSerializer):
+class BulletinPageSerializer(SparseFieldsetMixin, ModelSerializer):
     bulletin = BulletinSerializer()
 
     class Meta:
@@ -441,7 +548,7 @@ class BulletinPageSearchSerializer(HaystackSerializerMixin, BulletinPageSerializ
         search_fields = ("text",)
 
 
-class FinalThesisSerializer(FlexFieldsModelSerializer):
+class FinalThesisSerializer(TranslatedFieldsMixin, FlexFieldsModelSerializer):
     """
     ## Expansions
 
@@ -478,30 +585,34 @@ class FinalThesisSerializer(FlexFieldsModelSerializer):
     class Meta:
         model = models.FinalThesis
         fields = "__all__"
+        translated_fields = ("title", "abstract")
 
 
-class CountrySerializer(ModelSerializer):
+class CountrySerializer(TranslatedFieldsMixin, ModelSerializer):
     """"""
 
     class Meta:
         model = models.Country
         fields = "__all__"
+        translated_fields = ("name",)
 
 
-class ExamModeSerializer(ModelSerializer):
+class ExamModeSerializer(TranslatedFieldsMixin, ModelSerializer):
     """"""
 
     class Meta:
         model = models.ExamMode
         fields = "__all__"
+        translated_fields = ("name",)
 
 
-class ExamTypeSerializer(ModelSerializer):
+class ExamTypeSerializer(TranslatedFieldsMixin, ModelSerializer):
     """"""
 
     class Meta:
         model = models.ExamType
         fields = "__all__"
+        translated_fields = ("name", "certificate")
 
 
 class ExamSerializer(FlexFieldsModelSerializer):
@@ -547,12 +658,13 @@ class ExamSerializer(FlexFieldsModelSerializer):
         fields = "__all__"
 
 
-class ExamineeStatusSerializer(ModelSerializer):
+class ExamineeStatusSerializer(TranslatedFieldsMixin, ModelSerializer):
     """"""
 
     class Meta:
         model = models.ExamineeStatus
         fields = "__all__"
+        translated_fields = ("name",)
 
 
 class ExamineeSerializer(FlexFieldsModelSerializer):
@@ -585,7 +697,7 @@ class ExamineeSerializer(FlexFieldsModelSerializer):
         fields = "__all__"
 
 
-class ScienceBranchSerializer(FlexFieldsModelSerializer):
+class ScienceBranchSerializer(TranslatedFieldsMixin, FlexFieldsModelSerializer):
     """
     ## Expansions
 
@@ -612,3 +724,4 @@ class ScienceBranchSerializer(FlexFieldsModelSerializer):
     class Meta:
         model = models.ScienceBranch
         fields = "__all__"
+        translated_fields = ("name", "short")
@@ -1,7 +1,9 @@
 import logging
 from datetime import timedelta
+from itertools import islice
 
 from celery import shared_task
+from django.apps import apps
 from django.core.cache import (
     cache,
     caches,
@@ -9,12 +11,19 @@ from django.core.cache import (
 from django.core.cache.backends.base import InvalidCacheBackendError
 from django.db import connection
 from django.utils.translation import gettext_lazy as _
+from outpost.django.base.signals import materialized_view_refreshed
+from outpost.django.base.tasks import MaterializedViewTasks
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 
+from . import (
+    compression,
+    documents,
+)
 from .conf import settings
 from .models import (
     Person,
+    PersonAvatar,
     Student,
 )
 from .schema import linz
@@ -34,7 +43,7 @@ class SynchronizationTasks:
             logger.info("No meduniverse cache defined, not running")
             return
 
-        persons = Person.objects.all()
+        persons = Person.objects.only("username")
         for p in persons:
             cache.set(f"{p.__class__.__name__}:username:{p.username}", p.pk)
             cache.set(f"{p.__class__.__name__}:id:{p.pk}", p.username)
@@ -45,6 +54,60 @@ class SynchronizationTasks:
             cache.set(f"{s.__class__.__name__}:id:{s.pk}", s.username)
 
 
+class DocumentTasks:
+    @shared_task(bind=True, ignore_result=True, name=f"{__name__}.Document:build")
+    def build(task, label):
+        model = apps.get_model(label)
+        logger.info(f"Building documents for {label}")
+        documents.build(model)
+
+    @staticmethod
+    def refreshed(name, model, **kwargs):
+        if not settings.CAMPUSONLINE_DOCUMENTS:
+            return
+        for documented in documents.variants:
+            if model in documents.dependencies(documented):
+                DocumentTasks.build.delay(documented._meta.label_lower)
+
+
+materialized_view_refreshed.connect(
+    DocumentTasks.refreshed, sender=MaterializedViewTasks.refresh
+)
+
+
+class AvatarTasks:
+    @shared_task(bind=True, ignore_result=True, name=f"{__name__}.Avatar:prerender")
+    def prerender(task, hashes):
+        cache = caches[settings.CAMPUSONLINE_AVATAR_CACHE]
+        variants = list(PersonAvatar.variants())
+        keys = {
+            h: [PersonAvatar.variant_key(h, size, fmt) for size, fmt in variants]
+            for h in hashes
+        }
+        cached = cache.get_many([k for v in keys.values() for k in v])
+        missing = [h for h, v in keys.items() if not all(k in cached for k in v)]
+        logger.info(f"Rendering {len(missing)} of {len(hashes)} avatars")
+        for avatar in PersonAvatar.objects.filter(hash__in=missing):
+            avatar.prerender()
+
+    @staticmethod
+    def refreshed(name, model, **kwargs):
+        if model is not PersonAvatar:
+            return
+        hashes = PersonAvatar.objects.values_list("hash", flat=True).iterator()
+        size = settings.CAMPUSONLINE_AVATAR_PRERENDER_CHUNK_SIZE
+        while True:
+            chunk = list(islice(hashes, size))
+            if not chunk:
+                break
+            AvatarTasks.prerender.delay(chunk)
+
+
+materialized_view_refreshed.connect(
+    AvatarTasks.refreshed, sender=MaterializedViewTasks.refresh
+)
+
+
 class XMLTasks:
     @shared_task(bind=True, ignore_result=True, name=f"{__name__}.XML:hydrate")
     def hydrate(task):
@@ -128,6 +191,9 @@ class XMLTasks:
         config = SerializerConfig(pretty_print=True)
         serializer = XmlSerializer(config=config)
         body = serializer.render(root, ns_map={None: linz.__NAMESPACE__})
-        cache.set(settings.CAMPUSONLINE_XML_CACHE_KEY, body)
+        cache.set(
+            settings.CAMPUSONLINE_XML_CACHE_KEY,
+            compression.compress(body.encode("utf-8")),
+        )
         logging.info(f"Finished generating new XML body with size {len(body)}")
         return body
@@ -0,0 +1,10 @@
+from django import template
+
+from .. import normalize
+
+register = template.Library()
+
+
+@register.filter
+def fold(value):
+    return normalize.fold(value)
@@ -5,11 +5,26 @@ from . import views
 app_name = "campusonline"
 
 urlpatterns = [
+    url(
+        r"^avatar/batch$",
+        views.PrivateAvatarBatchView.as_view(),
+        name="avatar-private-batch",
+    ),
     url(
         r"^avatar/(?P<hash>[\w\d]+)$",
         views.PrivateAvatarView.as_view(),
         name="avatar-private",
     ),
+    url(
+        r"^autocomplete$",
+        views.AutocompleteView.as_view(),
+        name="autocomplete",
+    ),
+    url(
+        r"^search$",
+        views.SearchView.as_view(),
+        name="search",
+    ),
     url(
         r"^linz/xml$",
         views.XMLView.as_view(),
@@ -1,24 +1,43 @@
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from io import BytesIO
 from pathlib import Path
+from zipfile import (
+    ZIP_STORED,
+    ZipFile,
+)
 
 from django.core.cache import cache
 from django.http import (
     FileResponse,
     HttpResponse,
+    HttpResponseBadRequest,
     HttpResponseForbidden,
     HttpResponseNotFound,
 )
-from django.shortcuts import get_object_or_404
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.utils.cache import (
+    get_conditional_response,
+    patch_vary_headers,
+)
+from django.utils.http import quote_etag
 from django.views.generic import View
-from rest_framework import permissions
+from haystack.query import SearchQuerySet
+from rest_framework import (
+    permissions,
+    status,
+)
+from rest_framework.response import Response
 from rest_framework.views import APIView
 from wand.exceptions import WandException
-from wand.image import Image
 
 from . import (
+    autocomplete,
+    compression,
     models,
+    normalize,
+    refresh,
     tasks,
 )
 from .conf import settings
@@ -26,21 +45,225 @@ from .conf import settings
 logger = logging.getLogger(__name__)
 
 
-@method_decorator(cache_page(3600), name="dispatch")
 class PrivateAvatarView(View):
+    """
+    Serve a pre-rendered private avatar.
+
+    The optional `size` query parameter selects one of the configured
+    thumbnail sizes. The image format is negotiated from the `Accept` header,
+    preferring AVIF and WebP over JPEG if they are enabled.
+
+    As the hash changes with the image content, the response for a given hash,
+    size and format never changes. Conditional requests are answered without
+    looking at the image at all.
+    """
+
+    preferred = ("avif", "webp")
+
+    def negotiate(self, request):
+        accept = {
+            m.split(";")[0].strip()
+            for m in request.META.get("HTTP_ACCEPT", "").split(",")
+        }
+        for fmt in self.preferred:
+            if fmt not in settings.CAMPUSONLINE_AVATAR_FORMATS:
+                continue
+            if models.PersonAvatar.MIMETYPES[fmt] in accept:
+                return fmt
+        return "jpeg"
+
+    def get_size(self, request):
+        size = request.GET.get("size", None)
+        if size is None:
+            return None
+        if not size.isdigit() or int(size) not in settings.CAMPUSONLINE_AVATAR_SIZES:
+            raise ValueError(f"Unsupported avatar size: {size}")
+        return int(size)
+
     def get(self, request, hash):
-        p = get_object_or_404(models.Person, hash=hash)
         try:
-            with Image(blob=p.avatar_private.tobytes()) as img:
-                response = HttpResponse()
-                img.format = "jpeg"
-                img.save(file=response)
-                response["Content-Type"] = img.mimetype
-                response["Cache-Control"] = "private,max-age=604800"
-                return response
-        except WandException as e:
-            logger.warn(f"Failed to load image blob: {e}")
-        return HttpResponseNotFound()
+            size = self.get_size(request)
+        except ValueError:
+            return HttpResponseBadRequest()
+        fmt = self.negotiate(request)
+        etag = quote_etag(f"{hash}-{size or 'full'}.{fmt}")
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            try:
+                body = models.PersonAvatar.variant(hash, size, fmt)
+            except models.PersonAvatar.DoesNotExist:
+                return HttpResponseNotFound()
+            except WandException as e:
+                logger.warn(f"Failed to load image blob: {e}")
+                return HttpResponseNotFound()
+            response = HttpResponse(
+                body, content_type=models.PersonAvatar.MIMETYPES[fmt]
+            )
+        response["ETag"] = etag
+        response["Cache-Control"] = "private,max-age=31536000,immutable"
+        patch_vary_headers(response, ("Accept",))
+        return response
+
+
+class PrivateAvatarBatchView(PrivateAvatarView):
+    """
+    Serve multiple pre-rendered private avatars as a single ZIP archive.
+
+    Hashes are passed in the `hash` query parameter, either repeated or as a
+    comma separated list. They have to match the hashes accepted by
+    `PrivateAvatarView`, as they end up in cache keys. Each avatar is stored
+    as `<hash>.<format>` in the archive, unknown hashes are skipped.
+    """
+
+    hash_pattern = re.compile(r"[\w\d]{1,64}", re.ASCII)
+
+    def get(self, request):
+        hashes = {
+            h for v in request.GET.getlist("hash") for h in v.split(",") if h
+        }
+        if not hashes or len(hashes) > settings.CAMPUSONLINE_AVATAR_BATCH_LIMIT:
+            return HttpResponseBadRequest()
+        if not all(self.hash_pattern.fullmatch(h) for h in hashes):
+            return HttpResponseBadRequest()
+        try:
+            size = self.get_size(request)
+        except ValueError:
+            return HttpResponseBadRequest()
+        fmt = self.negotiate(request)
+        bodies = models.PersonAvatar.variant_many(hashes, size, fmt)
+        buf = BytesIO()
+        with ZipFile(buf, "w", ZIP_STORED) as archive:
+            for hash, body in sorted(bodies.items()):
+                archive.writestr(f"{hash}.{fmt}", body)
+        response = HttpResponse(buf.getvalue(), content_type="application/zip")
+        response["Cache-Control"] = "private,max-age=604800"
+        patch_vary_headers(response, ("Accept",))
+        return response
+
+
+class AutocompleteView(APIView):
+    """
+    Complete names of persons, students and rooms from in-process prefix
+    indexes.
+
+    The `q` query parameter is matched, ignoring case, accents and umlaut
+    spelling, against the beginning of first names, last names and full
+    names in either order, matriculation numbers and room titles and names.
+    Results can be limited to some types with `type=person,student,room` and
+    their number per type with `limit`. Anonymous users only find employed
+    persons and no students. While the indexes are built after startup the
+    view answers with `503 Service Unavailable` and a `Retry-After` header.
+    """
+
+    permission_classes = (permissions.AllowAny,)
+
+    def get(self, request, format=None):
+        prefix = " ".join(normalize.fold(request.query_params.get("q", "")).split())
+        if len(prefix) < settings.CAMPUSONLINE_NAME_FILTER_MIN_LENGHT:
+            return HttpResponseBadRequest()
+        limit = request.query_params.get(
+            "limit", settings.CAMPUSONLINE_AUTOCOMPLETE_LIMIT
+        )
+        try:
+            limit = int(limit)
+        except ValueError:
+            return HttpResponseBadRequest()
+        limit = max(1, min(limit, settings.CAMPUSONLINE_AUTOCOMPLETE_MAX_LIMIT))
+        types = request.query_params.get("type")
+        names = types.split(",") if types else autocomplete.registry.keys()
+        if any(name not in autocomplete.registry for name in names):
+            return HttpResponseBadRequest()
+        pending = [n for n in names if not autocomplete.registry[n].ready]
+        for name in pending:
+            autocomplete.registry[name].current()
+        if pending:
+            retry = settings.CAMPUSONLINE_AUTOCOMPLETE_CHECK_INTERVAL
+            return Response(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(retry)},
+            )
+        result = {}
+        for name in names:
+            found = autocomplete.registry[name].search(request, prefix, limit)
+            if found is not None:
+                result[name] = found
+        return Response(result)
+
+
+class SearchView(APIView):
+    """
+    Search persons, students, rooms and bulletin pages with one request.
+
+    The `q` query parameter is searched in all types at once, or those given
+    as `type=person,student,room,bulletin`, returning at most `limit` results
+    per type ranked by their score. Anonymous users only find employed
+    persons and no students. Responses are cached per normalized query and
+    authentication state until one of the searched models is refreshed.
+    """
+
+    permission_classes = (permissions.AllowAny,)
+    types = {
+        "person": models.Person,
+        "student": models.Student,
+        "room": models.Room,
+        "bulletin": models.BulletinPage,
+    }
+
+    def searchqueryset(self, name, authenticated):
+        sqs = SearchQuerySet().models(self.types[name])
+        if name == "person" and not authenticated:
+            sqs = sqs.filter(employed=True)
+        return sqs
+
+    def hit(self, name, result):
+        item = {"type": name, "id": result.pk, "score": result.score}
+        if name == "bulletin":
+            item["issue"] = result.issue
+            item["academic_year"] = result.academic_year
+        else:
+            item["presentation"] = result.presentation
+        return item
+
+    def search(self, name, authenticated, query, limit):
+        sqs = self.searchqueryset(name, authenticated).auto_query(query)
+        return [self.hit(name, r) for r in sqs[:limit]]
+
+    def get(self, request, format=None):
+        query = " ".join(request.query_params.get("q", "").lower().split())
+        if len(query) < settings.CAMPUSONLINE_NAME_FILTER_MIN_LENGHT:
+            return HttpResponseBadRequest()
+        limit = request.query_params.get("limit", settings.CAMPUSONLINE_SEARCH_LIMIT)
+        try:
+            limit = int(limit)
+        except ValueError:
+            return HttpResponseBadRequest()
+        limit = max(1, min(limit, settings.CAMPUSONLINE_SEARCH_MAX_LIMIT))
+        types = request.query_params.get("type")
+        names = sorted(set(types.split(",")) if types else self.types)
+        if any(n not in self.types for n in names):
+            return HttpResponseBadRequest()
+        authenticated = bool(request.user and request.user.is_authenticated)
+        if not authenticated:
+            names = [n for n in names if n != "student"]
+        generations = ":".join(str(refresh.generation(self.types[n])) for n in names)
+        digest = sha256(query.encode("utf-8")).hexdigest()
+        key = (
+            f"campusonline:search:{authenticated}:{','.join(names)}:{limit}:"
+            f"{generations}:{digest}"
+        )
+        results = cache.get(key)
+        if results is None:
+            # A pool per request, as a shared one would queue the searches of
+            # concurrent requests behind each other.
+            with ThreadPoolExecutor(max_workers=max(len(names), 1)) as executor:
+                futures = [
+                    executor.submit(self.search, n, authenticated, query, limit)
+                    for n in names
+                ]
+                hits = [hit for future in futures for hit in future.result()]
+            results = sorted(hits, key=lambda hit: hit["score"] or 0, reverse=True)
+            cache.set(key, results, settings.CAMPUSONLINE_SEARCH_CACHE_TIMEOUT)
+        return Response({"results": results})
 
 
 class XMLView(APIView):
@@ -51,11 +274,10 @@ class XMLView(APIView):
             return HttpResponseForbidden()
         response = HttpResponse()
         response["Content-Type"] = "application/xml"
-        xml = cache.get(settings.CAMPUSONLINE_XML_CACHE_KEY, None)
-        if not xml:
-            xml = tasks.XMLTasks().hydrate()
-        response.write(xml)
-        return response
+        bodies = cache.get(settings.CAMPUSONLINE_XML_CACHE_KEY, None)
+        if not isinstance(bodies, dict):
+            bodies = compression.compress(tasks.XMLTasks().hydrate().encode("utf-8"))
+        return compression.apply(response, request, bodies)
 
 
 class SchemaView(View):
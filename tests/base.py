@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from outpost.django.campusonline import models
+
+
+def unmanaged_models(app_label="campusonline"):
+    """
+    Unmanaged models of an app and the unmanaged models they are related to,
+    which are backed by materialized views instead of migrated tables.
+    """
+    result = {}
+    for model in apps.get_app_config(app_label).get_models():
+        related = [
+            f.related_model
+            for f in model._meta.get_fields()
+            if f.is_relation and f.related_model
+        ]
+        for m in [model] + related:
+            if not m._meta.managed and not m._meta.auto_created:
+                result[m._meta.label_lower] = m
+    return list(result.values())
+
+
+class UnmanagedModelsTestCase(TestCase):
+    """
+    Create plain tables for unmanaged models that have no table in the test
+    database, including their many-to-many tables.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        existing = set(connection.introspection.table_names())
+        cls.created = [
+            m for m in unmanaged_models() if m._meta.db_table not in existing
+        ]
+        with connection.schema_editor() as editor:
+            for model in cls.created:
+                editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            for model in reversed(cls.created):
+                editor.delete_model(model)
+
+
+class CampusonlineTestCase(UnmanagedModelsTestCase):
+    """
+    Test case with a small set of rooms, persons and course group terms.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        building = models.Building.objects.create(id=1, name="Zentrum", short="Z")
+        floor = models.Floor.objects.create(
+            id=1, short="EG", name={"de": "Erdgeschoß", "en": "Ground floor"}
+        )
+        category = models.RoomCategory.objects.create(id=1, name="Hörsaal")
+        cls.room = models.Room.objects.create(
+            id=1,
+            title="Hörsaal 1",
+            name_short="HS1",
+            name_full="Hörsaal 1   Zentrum",
+            building=building,
+            floor=floor,
+            category=category,
+        )
+        cls.bare_room = models.Room.objects.create(id=2, title=None)
+        cls.persons = [
+            models.Person.objects.create(
+                id=i,
+                first_name=first_name,
+                last_name=last_name,
+                email=f"{i}@example.org",
+                room=room,
+                hash=f"{i:040x}",
+                employed=True,
+                academic_title={"prefix": "Dr."},
+                miscellaneous_title={},
+                official_title={},
+            )
+            for i, first_name, last_name, room in (
+                (1, "Jörg", "Müller", cls.room),
+                (2, "Anna", None, None),
+            )
+        ]
+        course = models.Course.objects.create(
+            id=1, name="Anatomie", category="VO", year="2026", semester="W"
+        )
+        group = models.CourseGroup.objects.create(id=1, course=course, name="A")
+        start = timezone.make_aware(datetime(2026, 10, 19, 8, 15))
+        end = timezone.make_aware(datetime(2026, 10, 19, 9, 45))
+        for i, person, room in (
+            ("1", cls.persons[0], cls.room),
+            ("2", cls.persons[1], cls.bare_room),
+            ("3", cls.persons[0], None),
+        ):
+            models.CourseGroupTerm.objects.create(
+                id=i,
+                title=f"Termin {i}",
+                coursegroup=group,
+                person=person,
+                room=room,
+                start=start,
+                end=end,
+                term=i,
+            )
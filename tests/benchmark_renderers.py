@@ -0,0 +1,59 @@
+"""
+Compare `ORJSONRenderer` with `JSONRenderer` on a list shaped like a page of
+persons with nested rooms:
+
+    DJANGO_SETTINGS_MODULE=... python -m tests.benchmark_renderers
+"""
+import timeit
+from collections import OrderedDict
+from datetime import datetime
+
+import django
+
+
+def page(size=1000):
+    room = OrderedDict(
+        [
+            ("id", 1),
+            ("category", OrderedDict([("id", 1), ("name", "Hörsaal")])),
+            ("floor", OrderedDict([("id", 1), ("name", "Erdgeschoß")])),
+            ("building", OrderedDict([("id", 1), ("name", "Zentrum")])),
+            ("title", "Hörsaal 1"),
+            ("name_short", "HS1"),
+            ("name_full", "Hörsaal 1 Zentrum"),
+            ("organization", 10),
+            ("geo", None),
+        ]
+    )
+    return [
+        OrderedDict(
+            [
+                ("id", i),
+                ("room", room),
+                ("first_name", "Jörg"),
+                ("last_name", f"Müller {i}"),
+                ("title", "Dr."),
+                ("consultation", "Nach Vereinbarung"),
+                ("phone", "+43 316 385 0"),
+                ("modified", datetime(2026, 10, 18, 12, i % 60)),
+                ("academic_title", {"prefix": "Dr.", "suffix": "PhD"}),
+            ]
+        )
+        for i in range(size)
+    ]
+
+
+def main(number=20):
+    django.setup()
+    from rest_framework.renderers import JSONRenderer
+
+    from outpost.django.campusonline.renderers import ORJSONRenderer
+
+    data = page()
+    for renderer in (JSONRenderer(), ORJSONRenderer()):
+        seconds = timeit.timeit(lambda: renderer.render(data), number=number)
+        print(f"{type(renderer).__name__}: {seconds / number * 1000:.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
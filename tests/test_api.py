@@ -0,0 +1,171 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import (
+    APIRequestFactory,
+    force_authenticate,
+)
+
+from outpost.django.campusonline import (
+    api,
+    models,
+)
+
+from .base import CampusonlineTestCase
+
+
+class QueryCountTest(CampusonlineTestCase):
+    """
+    Each endpoint renders its related objects with a fixed number of queries,
+    independent of the number of objects.
+
+    Lists are requested once with the fixtures and again after `grow` added
+    more objects with the same relations, expecting the same number of queries
+    both times.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.function = models.Function.objects.create(
+            id=1, name="Leitung", category="rechtliche", leader=True
+        )
+        cls.organization = models.Organization.objects.create(
+            id=1,
+            name={"de": "Zentrum", "en": "Center"},
+            sib_order=1,
+            university_law=True,
+        )
+        for person in cls.persons:
+            cls.assign(person)
+            person.organizations.add(cls.organization)
+        cls.event(1)
+
+    @classmethod
+    def assign(cls, person):
+        models.PersonOrganizationFunction.objects.create(
+            id=f"{person.pk}-{cls.organization.pk}-{cls.function.pk}",
+            person=person,
+            organization=cls.organization,
+            function=cls.function,
+        )
+
+    @classmethod
+    def event(cls, i):
+        now = timezone.now()
+        models.Event.objects.create(
+            course_id=1,
+            category="Vorlesung",
+            title=f"Veranstaltung {i}",
+            date=now.date(),
+            start=now,
+            end=now + timedelta(hours=1),
+            building_id=1,
+            room=cls.room,
+            show_end=now + timedelta(days=1),
+        )
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def get(self, viewset, action="list", user=None, **kwargs):
+        cache.clear()
+        request = self.factory.get("/")
+        if user is not None:
+            force_authenticate(request, user=user)
+        view = viewset.as_view({"get": action})
+        response = view(request, **kwargs)
+        response.render()
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def assertConstantQueries(self, num, grow, viewset, **kwargs):
+        for size in ("fixtures", "grown"):
+            if size == "grown":
+                grow()
+            with self.subTest(objects=size), self.assertNumQueries(num):
+                self.get(viewset, **kwargs)
+
+    def grow_rooms(self):
+        for i in range(3, 6):
+            models.Room.objects.create(
+                id=i,
+                title=f"Seminarraum {i}",
+                name_short=f"SR{i}",
+                name_full=f"Seminarraum {i} Zentrum",
+                building_id=1,
+                floor_id=1,
+                category_id=1,
+            )
+
+    def grow_persons(self):
+        for i in range(3, 6):
+            person = models.Person.objects.create(
+                id=i,
+                first_name="Eva",
+                last_name=f"Berger {i}",
+                email=f"{i}@example.org",
+                room=self.room,
+                hash=f"{i:040x}",
+                employed=True,
+                academic_title={},
+                miscellaneous_title={},
+                official_title={},
+            )
+            self.assign(person)
+            person.organizations.add(self.organization)
+            person.organizations_leave.add(self.organization)
+
+    def grow_terms(self):
+        term = models.CourseGroupTerm.objects.get(pk="1")
+        for i in range(4, 7):
+            term.pk = str(i)
+            term.term = i
+            term.save(force_insert=True)
+
+    def grow_events(self):
+        for i in range(2, 5):
+            self.event(i)
+
+    def test_room_list(self):
+        self.assertConstantQueries(1, self.grow_rooms, api.RoomViewSet)
+
+    def test_room_retrieve(self):
+        for room in (self.bare_room, self.room):
+            with self.subTest(room=room.pk), self.assertNumQueries(1):
+                self.get(api.RoomViewSet, "retrieve", pk=room.pk)
+
+    def test_person_list(self):
+        self.assertConstantQueries(1, self.grow_persons, api.PersonViewSet)
+
+    def test_person_retrieve(self):
+        for person in self.persons:
+            with self.subTest(person=person.pk), self.assertNumQueries(1):
+                self.get(api.PersonViewSet, "retrieve", pk=person.pk)
+
+    def test_person_list_authenticated(self):
+        # Functions, organizations and organizations on leave are prefetched.
+        self.assertConstantQueries(
+            4, self.grow_persons, api.PersonViewSet, user=User(username="staff")
+        )
+
+    def test_person_organization_function_list(self):
+        self.assertConstantQueries(
+            1,
+            self.grow_persons,
+            api.PersonOrganizationFunctionViewSet,
+            user=User(username="staff"),
+        )
+
+    def test_event_list(self):
+        self.assertConstantQueries(1, self.grow_events, api.EventViewSet)
+
+    def test_course_group_term_list(self):
+        self.assertConstantQueries(
+            1,
+            self.grow_terms,
+            api.CourseGroupTermViewSet,
+            user=User(username="staff"),
+        )
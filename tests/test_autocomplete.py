@@ -0,0 +1,157 @@
+from unittest import mock
+
+from django.contrib.auth.models import (
+    AnonymousUser,
+    User,
+)
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+)
+
+from outpost.django.campusonline import (
+    autocomplete,
+    models,
+    views,
+)
+
+from .base import CampusonlineTestCase
+
+
+class PrefixIndexTest(SimpleTestCase):
+    def setUp(self):
+        self.index = autocomplete.PrefixIndex(
+            [
+                (("Müller", "Jörg Müller"), "mueller"),
+                (("Mueller",), "mueller-plain"),
+                (("Muster",), "muster"),
+                (("Zyx",), "zyx"),
+                (("", None), "empty"),
+            ]
+        )
+
+    def test_folded(self):
+        self.assertEqual(self.index.search("mueller", 10), ["mueller", "mueller-plain"])
+        self.assertEqual(self.index.search("joerg", 10), ["mueller"])
+
+    def test_bounds(self):
+        self.assertEqual(
+            self.index.search("mu", 10), ["mueller", "mueller-plain", "muster"]
+        )
+        self.assertEqual(self.index.search("zyx", 10), ["zyx"])
+        self.assertEqual(self.index.search("zz", 10), [])
+        self.assertEqual(self.index.search("a", 10), [])
+        self.assertEqual(self.index.search("mustera", 10), [])
+
+    def test_limit(self):
+        self.assertEqual(self.index.search("mu", 1), ["mueller"])
+        self.assertEqual(self.index.search("mu", 2), ["mueller", "mueller-plain"])
+
+    def test_deduplicated(self):
+        index = autocomplete.PrefixIndex([(("Anna", "Anna Berg", "Berg"), "anna")])
+        self.assertEqual(index.search("", 10), ["anna"])
+        self.assertEqual(index.search("anna", 10), ["anna"])
+
+    def test_empty(self):
+        self.assertEqual(autocomplete.PrefixIndex([]).search("a", 10), [])
+
+
+class Counting(autocomplete.Autocomplete):
+    model = models.Person
+
+    def __init__(self):
+        super().__init__()
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return {None: autocomplete.PrefixIndex([])}
+
+    def index(self, request):
+        indexes = self.current()
+        return None if indexes is None else indexes[None]
+
+
+class AutocompleteTest(SimpleTestCase):
+    def test_rebuild_on_generation(self):
+        index = Counting()
+        self.assertFalse(index.ready)
+        with mock.patch.object(
+            autocomplete.refresh, "generation", side_effect=[1.0, 1.0, 2.0]
+        ):
+            index.update()
+            index.update()
+            self.assertEqual(index.builds, 1)
+            index.update()
+            self.assertEqual(index.builds, 2)
+        self.assertTrue(index.ready)
+
+    def test_current_does_not_build(self):
+        index = Counting()
+        with mock.patch.object(index, "warm") as warm:
+            self.assertIsNone(index.current())
+        warm.assert_called_once()
+        self.assertEqual(index.builds, 0)
+
+    def test_current_throttled(self):
+        index = Counting()
+        with mock.patch.object(autocomplete.refresh, "generation", return_value=1.0):
+            index.update()
+        index.checked = autocomplete.time.monotonic()
+        with mock.patch.object(index, "warm") as warm:
+            self.assertIsNotNone(index.current())
+        warm.assert_not_called()
+
+    def test_update_skipped_while_building(self):
+        index = Counting()
+        index.lock.acquire()
+        try:
+            index.update()
+        finally:
+            index.lock.release()
+        self.assertEqual(index.builds, 0)
+
+
+class AutocompleteViewTest(SimpleTestCase):
+    def test_not_ready(self):
+        request = RequestFactory().get("/autocomplete", {"q": "mu", "type": "room"})
+        request.user = AnonymousUser()
+        with mock.patch.dict(views.autocomplete.registry, {"room": Counting()}):
+            with mock.patch.object(Counting, "warm") as warm:
+                response = views.AutocompleteView.as_view()(request)
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Retry-After", response)
+        warm.assert_called_once()
+
+
+class PersonAutocompleteTest(CampusonlineTestCase):
+    def setUp(self):
+        models.Person.objects.filter(pk=2).update(employed=False)
+        self.autocomplete = autocomplete.PersonAutocomplete()
+        with mock.patch.object(autocomplete.refresh, "generation", return_value=1.0):
+            self.autocomplete.update()
+        self.autocomplete.checked = autocomplete.time.monotonic()
+
+    def request(self, user):
+        request = RequestFactory().get("/autocomplete")
+        request.user = user
+        return request
+
+    def test_anonymous(self):
+        request = self.request(AnonymousUser())
+        self.assertEqual(
+            [p["id"] for p in self.autocomplete.search(request, "mueller", 10)], [1]
+        )
+        self.assertEqual(self.autocomplete.search(request, "anna", 10), [])
+
+    def test_authenticated(self):
+        request = self.request(User(username="staff"))
+        self.assertEqual(
+            [p["id"] for p in self.autocomplete.search(request, "anna", 10)], [2]
+        )
+
+    def test_student_anonymous(self):
+        students = autocomplete.StudentAutocomplete()
+        with mock.patch.object(students, "warm") as warm:
+            self.assertIsNone(students.search(self.request(AnonymousUser()), "mu", 10))
+        warm.assert_not_called()
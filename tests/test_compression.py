@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+
+from outpost.django.campusonline.compression import negotiate
+
+
+class NegotiateTest(SimpleTestCase):
+    available = {"identity": b"", "gzip": b"", "br": b""}
+
+    def assertNegotiates(self, header, coding, available=None):
+        self.assertEqual(negotiate(header, available or self.available), coding)
+
+    def test_missing(self):
+        self.assertNegotiates("", "identity")
+        self.assertNegotiates("deflate", "identity")
+
+    def test_preference(self):
+        self.assertNegotiates("gzip, br", "br")
+        self.assertNegotiates("gzip;q=0.8, br;q=0.8", "br")
+        self.assertNegotiates("gzip, br", "gzip", {"identity": b"", "gzip": b""})
+
+    def test_quality(self):
+        self.assertNegotiates("br;q=0.5, gzip", "gzip")
+        self.assertNegotiates("gzip;q=0.2, identity;q=0.5", "identity")
+        self.assertNegotiates("gzip;level=9;q=0.9, br;q=0.4", "gzip")
+
+    def test_wildcard(self):
+        self.assertNegotiates("*", "br")
+        self.assertNegotiates("br;q=0, *;q=0.3", "gzip")
+
+    def test_excluded(self):
+        self.assertNegotiates("identity;q=0, gzip;q=0.1", "gzip")
+        self.assertNegotiates("*;q=0", "identity")
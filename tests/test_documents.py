@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import (
+    SimpleTestCase,
+    override_settings,
+)
+
+from outpost.django.campusonline import documents
+
+
+class ContextTest(SimpleTestCase):
+    @override_settings(CAMPUSONLINE_DOCUMENTS=True, CAMPUSONLINE_DOCUMENT_HOST=None)
+    def test_host_required(self):
+        with self.assertRaises(ImproperlyConfigured):
+            documents.context()
+
+    @override_settings(
+        CAMPUSONLINE_DOCUMENTS=True, CAMPUSONLINE_DOCUMENT_HOST="api.example.org"
+    )
+    def test_absolute_urls(self):
+        request = documents.context()["request"]
+        self.assertEqual(
+            request.build_absolute_uri("/avatar/abc"),
+            "https://api.example.org/avatar/abc",
+        )
+
+    @override_settings(CAMPUSONLINE_DOCUMENTS=False, CAMPUSONLINE_DOCUMENT_HOST=None)
+    def test_disabled(self):
+        self.assertEqual(documents.context(), {"request": None})
+
+
+class RendererTest(SimpleTestCase):
+    def test_key_order(self):
+        data = OrderedDict([("last_name", "Muster"), ("id", 1), ("first_name", "Ö")])
+        self.assertEqual(
+            documents.renderer().render(data),
+            '{"last_name":"Muster","id":1,"first_name":"Ö"}'.encode("utf-8"),
+        )
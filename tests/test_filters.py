@@ -0,0 +1,67 @@
+from django.test import SimpleTestCase
+
+from outpost.django.campusonline import models
+from outpost.django.campusonline.filters import (
+    name_terms,
+    search_names,
+)
+
+from .base import CampusonlineTestCase
+
+
+class NameTermsTest(SimpleTestCase):
+    def test_split(self):
+        self.assertEqual(name_terms("Jörg  Müller"), ["Jörg", "Müller"])
+        self.assertEqual(name_terms("Müller, Jörg;"), ["Müller", "Jörg"])
+        self.assertEqual(name_terms("Müller-Lüdenscheidt"), ["Müller-Lüdenscheidt"])
+
+    def test_dotted_titles(self):
+        self.assertEqual(name_terms("Dr. Jörg Müller"), ["Jörg", "Müller"])
+        self.assertEqual(name_terms("Univ.-Prof. Dr. Müller"), ["Müller"])
+
+    def test_undotted_titles(self):
+        self.assertEqual(name_terms("Prof Müller"), ["Müller"])
+        self.assertEqual(name_terms("Univ-Prof DR Müller"), ["Müller"])
+        self.assertEqual(name_terms("Müller PhD"), ["Müller"])
+
+    def test_punctuation(self):
+        self.assertEqual(name_terms("'Müller'"), ["Müller"])
+
+    def test_fallback(self):
+        self.assertEqual(name_terms(" Dr. "), ["Dr."])
+        self.assertEqual(name_terms("Prof"), ["Prof"])
+
+
+class SearchNamesTest(CampusonlineTestCase):
+    def setUp(self):
+        models.Person.objects.create(
+            id=3,
+            first_name="Jürgen",
+            last_name="Müllner",
+            email="3@example.org",
+            hash=f"{3:040x}",
+            employed=True,
+            academic_title={},
+            miscellaneous_title={},
+            official_title={},
+        )
+
+    def search(self, value):
+        return list(
+            search_names(models.Person.objects.all(), name_terms(value)).values_list(
+                "id", flat=True
+            )
+        )
+
+    def test_ranked(self):
+        self.assertEqual(self.search("Müller"), [1, 3])
+        self.assertEqual(self.search("Muellner"), [3, 1])
+
+    def test_folded(self):
+        for value in ("Müller", "Mueller", "MULLER", "Dr. Jörg Mueller"):
+            with self.subTest(value=value):
+                self.assertEqual(self.search(value)[0], 1)
+
+    def test_all_terms(self):
+        self.assertEqual(self.search("Prof Jörg Müller"), [1])
+        self.assertEqual(self.search("Anna Müller"), [])
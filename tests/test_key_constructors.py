@@ -0,0 +1,63 @@
+from django.test import SimpleTestCase
+
+from outpost.django.campusonline import models
+from outpost.django.campusonline.key_constructors import serializer_models
+from outpost.django.campusonline.serializers import (
+    AuthenticatedOrganizationSerializer,
+    AuthenticatedPersonSerializer,
+    DistributionListSerializer,
+    FunctionSerializer,
+    RoomSerializer,
+)
+
+
+def through(model, name):
+    return model._meta.get_field(name).remote_field.through
+
+
+class SerializerModelsTest(SimpleTestCase):
+    def test_many_to_many_through(self):
+        self.assertEqual(
+            serializer_models(FunctionSerializer()),
+            {models.Function, models.Person, models.PersonOrganizationFunction},
+        )
+
+    def test_reverse_many_to_many(self):
+        self.assertLessEqual(
+            {
+                models.Organization,
+                models.Person,
+                through(models.Person, "organizations"),
+                through(models.Person, "organizations_leave"),
+            },
+            serializer_models(AuthenticatedOrganizationSerializer()),
+        )
+
+    def test_forward_many_to_many(self):
+        self.assertLessEqual(
+            {
+                models.Person,
+                models.Function,
+                models.Organization,
+                models.PersonOrganizationFunction,
+                through(models.Person, "organizations"),
+                through(models.Person, "organizations_leave"),
+            },
+            serializer_models(AuthenticatedPersonSerializer()),
+        )
+
+    def test_auto_created_through(self):
+        self.assertEqual(
+            serializer_models(DistributionListSerializer()),
+            {
+                models.DistributionList,
+                models.Person,
+                models.Student,
+                through(models.DistributionList, "persons"),
+                through(models.DistributionList, "students"),
+            },
+        )
+
+    def test_reverse_one_to_one(self):
+        geo = models.Room._meta.get_field("geo").related_model
+        self.assertIn(geo, serializer_models(RoomSerializer()))
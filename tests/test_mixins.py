@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+)
+
+from outpost.django.campusonline.mixins import ConditionalMixin
+from outpost.django.campusonline.serializers import (
+    CountrySerializer,
+    FunctionSerializer,
+)
+
+
+class FunctionView(ConditionalMixin):
+    def get_serializer(self):
+        return FunctionSerializer()
+
+
+class ConditionalMixinTest(SimpleTestCase):
+    def generations(self, **changed):
+        def generation(model):
+            return changed.get(model._meta.object_name, 1000.0)
+
+        return mock.patch(
+            "outpost.django.campusonline.refresh.generation", generation
+        )
+
+    def test_last_modified(self):
+        with self.generations():
+            self.assertEqual(FunctionView().get_last_modified(), 1000)
+
+    def test_last_modified_through(self):
+        with self.generations(PersonOrganizationFunction=2000.5):
+            self.assertEqual(FunctionView().get_last_modified(), 2000)
+
+    def test_last_modified_related(self):
+        with self.generations(Person=3000.0):
+            self.assertEqual(FunctionView().get_last_modified(), 3000)
+
+
+class CountryView(ConditionalMixin):
+    def get_serializer(self):
+        return CountrySerializer()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        return response
+
+
+class ConditionalMixinUnsignaledTest(SimpleTestCase):
+    def get(self, **headers):
+        request = RequestFactory().get("/", **headers)
+        handler = mock.Mock(return_value=HttpResponse(b'[{"alpha2":"AT"}]'))
+        return CountryView().conditional(handler, request), handler
+
+    def test_content_etag(self):
+        response, _ = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_not_modified(self):
+        etag = self.get()[0]["ETag"]
+        response, _ = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
@@ -0,0 +1,32 @@
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from outpost.django.campusonline import models
+from outpost.django.campusonline.pagination import NaturalOrderingCursorPagination
+
+from .base import CampusonlineTestCase
+
+
+class NaturalOrderingCursorPaginationTest(CampusonlineTestCase):
+    def pages(self, queryset):
+        url = "/?page_size=1"
+        while url:
+            paginator = NaturalOrderingCursorPagination()
+            request = Request(APIRequestFactory().get(url))
+            yield paginator.paginate_queryset(queryset, request)
+            url = paginator.get_next_link()
+
+    def test_null_leading_column(self):
+        pages = list(self.pages(models.Person.objects.all()))
+        self.assertEqual(
+            [p.pk for page in pages for p in page],
+            [self.persons[1].pk, self.persons[0].pk],
+        )
+
+    def test_null_leading_column_values(self):
+        queryset = models.Person.objects.values("id", "last_name")
+        pages = list(self.pages(queryset))
+        self.assertEqual(
+            [p["id"] for page in pages for p in page],
+            [self.persons[1].pk, self.persons[0].pk],
+        )
@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from outpost.django.campusonline import (
+    models,
+    refresh,
+)
+from outpost.django.campusonline.conf import settings
+from outpost.django.campusonline.key_constructors import serializer_generations
+from outpost.django.campusonline.mixins import RefreshCacheResponseMixin
+from outpost.django.campusonline.serializers import (
+    CountrySerializer,
+    DistributionListSerializer,
+)
+
+
+class RefreshTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_signaled(self):
+        through = models.DistributionList._meta.get_field("persons").remote_field
+        self.assertTrue(refresh.signaled(models.Person))
+        self.assertTrue(refresh.signaled(through.through))
+        self.assertFalse(refresh.signaled(models.Country))
+
+    def test_generation(self):
+        self.assertIsNone(refresh.generation(models.Country))
+        first = refresh.generation(models.Person)
+        self.assertEqual(refresh.generation(models.Person), first)
+        refresh.refreshed(None, models.Person)
+        self.assertGreaterEqual(refresh.generation(models.Person), first)
+
+    def test_through_generation(self):
+        through = models.DistributionList._meta.get_field("persons").remote_field
+        refresh.refreshed(None, models.DistributionList)
+        self.assertEqual(
+            refresh.generation(through.through),
+            refresh.generation(models.DistributionList),
+        )
+
+    def test_serializer_generations(self):
+        self.assertEqual(serializer_generations(CountrySerializer()), {})
+        self.assertIn(
+            "campusonline.person",
+            serializer_generations(DistributionListSerializer()),
+        )
+
+
+class CacheTimeoutTest(SimpleTestCase):
+    def view(self, serializer_class):
+        class View(RefreshCacheResponseMixin):
+            def get_serializer(self):
+                return serializer_class()
+
+        return View()
+
+    def test_signaled(self):
+        self.assertEqual(
+            self.view(DistributionListSerializer).get_cache_timeout(),
+            settings.CAMPUSONLINE_RESPONSE_CACHE_TIMEOUT,
+        )
+
+    def test_unsignaled(self):
+        self.assertEqual(
+            self.view(CountrySerializer).get_cache_timeout(),
+            settings.CAMPUSONLINE_UNSIGNALED_CACHE_TIMEOUT,
+        )
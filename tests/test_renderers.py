@@ -0,0 +1,43 @@
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from outpost.django.campusonline.renderers import (
+    ORJSONRenderer,
+    orjson,
+)
+
+
+@skipIf(orjson is None, "orjson is not installed")
+class ORJSONRendererTest(SimpleTestCase):
+    def assertSame(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_same_output(self):
+        self.assertSame(
+            OrderedDict(
+                [
+                    ("name", "Hörsaal A"),
+                    ("id", 1),
+                    ("start", datetime(2026, 10, 19, 8, 15)),
+                    ("area", Decimal("12.5")),
+                    ("ratio", 0.25),
+                    ("tags", ["a", None, True]),
+                    ("names", {1: "eins"}),
+                ]
+            )
+        )
+
+    def test_large_integers(self):
+        self.assertSame({"id": 2 ** 64})
+        self.assertSame({"id": -(2 ** 63) - 1})
+
+    def test_float_exponents(self):
+        renderer = ORJSONRenderer()
+        self.assertEqual(renderer.render({"v": 1e16}), b'{"v":1e16}')
+        self.assertEqual(renderer.render({"v": 1.5e-7}), b'{"v":1.5e-7}')
+        self.assertEqual(renderer.render({"v": 1e-5}), b'{"v":0.00001}')
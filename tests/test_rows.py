@@ -0,0 +1,35 @@
+from rest_framework.renderers import JSONRenderer
+
+from outpost.django.campusonline import (
+    models,
+    rows,
+)
+from outpost.django.campusonline.mixins import ordering_columns
+from outpost.django.campusonline.serializers import (
+    CourseGroupTermSerializer,
+    RoomSerializer,
+)
+
+from .base import CampusonlineTestCase
+
+
+class PlanTest(CampusonlineTestCase):
+    def assertIdentical(self, queryset, serializer_class):
+        plan = rows.Plan(queryset.model, serializer_class())
+        columns = dict.fromkeys(plan.columns + ordering_columns(queryset))
+        values = plan.render(list(queryset.values(*columns)))
+        data = serializer_class(queryset, many=True).data
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(values), renderer.render(data))
+
+    def test_reverse_one_to_one(self):
+        plan = rows.Plan(models.Room, RoomSerializer())
+        self.assertIn("geo__pk", plan.columns)
+        self.assertIdentical(models.Room.objects.all(), RoomSerializer)
+
+    def test_course_group_term(self):
+        plan = rows.Plan(models.CourseGroupTerm, CourseGroupTermSerializer())
+        self.assertIn("room__geo__pk", plan.columns)
+        self.assertIdentical(
+            models.CourseGroupTerm.objects.all(), CourseGroupTermSerializer
+        )
@@ -0,0 +1,85 @@
+from django.test import (
+    SimpleTestCase,
+    override_settings,
+)
+from rest_framework import serializers
+from rest_framework.fields import HStoreField
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from outpost.django.campusonline import (
+    languages,
+    models,
+)
+from outpost.django.campusonline.serializers import (
+    FloorSerializer,
+    PersonSerializer,
+    TranslatedField,
+)
+
+from .base import CampusonlineTestCase
+
+
+class TranslatedSerializer(serializers.Serializer):
+    name = TranslatedField()
+
+
+@override_settings(LANGUAGES=[("de", "German"), ("en", "English")])
+class TranslatedFieldTest(SimpleTestCase):
+    def represent(self, value, query=None):
+        request = Request(APIRequestFactory().get("/", query or {}))
+        serializer = TranslatedSerializer(context={"request": request})
+        return serializer.fields["name"].to_representation(value)
+
+    def test_full(self):
+        value = {"de": "Gebäude", "en": "Building"}
+        self.assertEqual(self.represent(value), value)
+
+    def test_language(self):
+        value = {"de": "Gebäude", "en": "Building"}
+        self.assertEqual(self.represent(value, {"lang": "en"}), "Building")
+        self.assertEqual(self.represent(value, {"lang": "de-AT"}), "Gebäude")
+
+    def test_fallback(self):
+        value = {"de": "Gebäude", "en": ""}
+        self.assertEqual(self.represent(value, {"lang": "en"}), "Gebäude")
+        self.assertIsNone(self.represent({}, {"lang": "en"}))
+
+    def test_projected(self):
+        self.assertEqual(self.represent("Building", {"lang": "en"}), "Building")
+        self.assertEqual(self.represent("Building"), "Building")
+        self.assertIsNone(self.represent(None, {"lang": "en"}))
+
+
+class TranslatedFieldsMixinTest(SimpleTestCase):
+    def test_translated_fields(self):
+        fields = FloorSerializer().fields
+        self.assertIsInstance(fields["name"], TranslatedField)
+
+    def test_title_fields(self):
+        fields = PersonSerializer().fields
+        for name in ("academic_title", "miscellaneous_title", "official_title"):
+            with self.subTest(name=name):
+                self.assertIsInstance(fields[name], HStoreField)
+                self.assertNotIsInstance(fields[name], TranslatedField)
+
+
+@override_settings(LANGUAGES=[("de", "German"), ("en", "English")])
+class TranslationProjectionTest(CampusonlineTestCase):
+    def test_empty_translation(self):
+        models.Floor.objects.create(
+            id=2, short="1", name={"de": "Erster Stock", "en": ""}
+        )
+        request = Request(APIRequestFactory().get("/", {"lang": "en"}))
+        chain = languages.chain(request)
+        projected = models.Floor.objects.annotate(
+            **{languages.alias("name"): languages.projection("name", chain)}
+        ).get(id=2)
+        context = {"request": request}
+        self.assertEqual(
+            FloorSerializer(projected, context=context).data["name"], "Erster Stock"
+        )
+        floor = models.Floor.objects.get(id=2)
+        self.assertEqual(
+            FloorSerializer(floor, context=context).data["name"], "Erster Stock"
+        )
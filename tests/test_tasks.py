@@ -0,0 +1,51 @@
+from unittest import mock
+
+from django.test import (
+    SimpleTestCase,
+    override_settings,
+)
+
+from outpost.django.campusonline import tasks
+from outpost.django.campusonline.models import PersonAvatar
+
+
+@override_settings(
+    CAMPUSONLINE_AVATAR_SIZES=(64,),
+    CAMPUSONLINE_AVATAR_FORMATS=("jpeg",),
+    CAMPUSONLINE_AVATAR_PRERENDER_CHUNK_SIZE=2,
+)
+class AvatarTasksTest(SimpleTestCase):
+    def test_refreshed_chunks(self):
+        objects = mock.Mock()
+        objects.values_list.return_value.iterator.return_value = iter("abcde")
+        with mock.patch.object(PersonAvatar, "objects", objects), mock.patch.object(
+            tasks.AvatarTasks.prerender, "delay"
+        ) as delay:
+            tasks.AvatarTasks.refreshed(None, PersonAvatar)
+        self.assertEqual(
+            delay.call_args_list,
+            [mock.call(["a", "b"]), mock.call(["c", "d"]), mock.call(["e"])],
+        )
+
+    def test_refreshed_other_model(self):
+        with mock.patch.object(tasks.AvatarTasks.prerender, "delay") as delay:
+            tasks.AvatarTasks.refreshed(None, tasks.Person)
+        delay.assert_not_called()
+
+    def test_prerender_missing(self):
+        cache = mock.Mock()
+        cache.get_many.return_value = {
+            PersonAvatar.variant_key("a", None, "jpeg"): b"",
+            PersonAvatar.variant_key("a", 64, "jpeg"): b"",
+            PersonAvatar.variant_key("b", None, "jpeg"): b"",
+        }
+        objects = mock.Mock()
+        objects.filter.return_value = []
+        with mock.patch.object(
+            tasks, "caches", {"default": cache}
+        ), mock.patch.object(PersonAvatar, "objects", objects), override_settings(
+            CAMPUSONLINE_AVATAR_CACHE="default"
+        ):
+            tasks.AvatarTasks.prerender(["a", "b"])
+        cache.get_many.assert_called_once()
+        objects.filter.assert_called_once_with(hash__in=["b"])
@@ -0,0 +1,30 @@
+from unittest import mock
+
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+)
+
+from outpost.django.campusonline import views
+
+
+class PrivateAvatarBatchViewTest(SimpleTestCase):
+    def get(self, query):
+        request = RequestFactory().get("/avatar/batch", query)
+        with mock.patch.object(
+            views.models.PersonAvatar, "variant_many", return_value={}
+        ) as variant_many:
+            response = views.PrivateAvatarBatchView.as_view()(request)
+        return response, variant_many
+
+    def test_valid(self):
+        response, variant_many = self.get({"hash": "0a1b2c,3d4e5f"})
+        self.assertEqual(response.status_code, 200)
+        variant_many.assert_called_once()
+
+    def test_invalid(self):
+        for value in ("abc def", "abc:def", "a" * 65, "äbc", "../abc"):
+            with self.subTest(value=value):
+                response, variant_many = self.get({"hash": value})
+                self.assertEqual(response.status_code, 400)
+                variant_many.assert_not_called()